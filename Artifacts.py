@@ -0,0 +1,90 @@
+# Zwischenergebnisse der Pipeline als Parquet-Dateien (spaltenbasiert, typisiert, komprimiert).
+# Sie ersetzen die CSV/XLSX-Zwischendateien: Schreiben und Lesen dauert Millisekunden statt Sekunden,
+# und Datumsformatierung.py bzw. NotionAPI.py können damit nach einem Absturz einzeln neu gestartet werden.
+#
+#   scraped_events.parquet            nach dem Scrapen
+#   scraped_events_formatted.parquet  nach Datumsformatierung und Duplikat-Abgleich
+#
+# Die Excel-Datei für Menschen wird nur auf Wunsch (event-scraper.py --excel) einmal am Ende geschrieben,
+# über den write-only-Modus von openpyxl, der die Zeilen direkt in die Datei streamt.
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+COLUMNS = ["Organisation", "Titel", "Datum", "Location", "Description", "Link"]
+SCHEMA = pa.schema([(column, pa.string()) for column in COLUMNS])
+
+SCRAPED_PATH = "scraped_events.parquet"
+FORMATTED_PATH = "scraped_events_formatted.parquet"
+
+# Zeilen pro Row-Group beim Streaming-Schreiben
+ROW_GROUP_SIZE = 500
+
+
+def _value(value):
+    if value is None or value != value:    # None oder NaN
+        return None
+    return str(value)
+
+
+def to_table(events):
+    return pa.Table.from_pydict(
+        {column: [_value(event.get(column)) for event in events] for column in COLUMNS},
+        schema=SCHEMA,
+    )
+
+
+def write_events(events, path):
+    """Schreibt eine Liste von Event-Dicts als Parquet-Datei."""
+    pq.write_table(to_table(events), path, compression="zstd")
+    print(f"{len(events)} Events gespeichert in '{path}'")
+
+
+def read_events(path):
+    """Liest eine mit write_events() geschriebene Datei als Liste von Event-Dicts."""
+    return pq.read_table(path, columns=COLUMNS).to_pylist()
+
+
+class ParquetStream:
+    """Schreibt Events einzeln (z. B. aus der Streaming-Pipeline) blockweise in eine Parquet-Datei."""
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = pq.ParquetWriter(path, SCHEMA, compression="zstd")
+        self.buffer = []
+        self.count = 0
+
+    def write(self, event):
+        self.buffer.append(event)
+        if len(self.buffer) >= ROW_GROUP_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.writer.write_table(to_table(self.buffer))
+            self.count += len(self.buffer)
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+        print(f"{self.count} Events gespeichert in '{self.path}'")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_excel(events, path):
+    """Schreibt die Events einmalig als Excel-Datei (openpyxl write-only, Zeile für Zeile)."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Events")
+    sheet.append(COLUMNS)
+    count = 0
+    for event in events:
+        sheet.append([_value(event.get(column)) for column in COLUMNS])
+        count += 1
+    workbook.save(path)
+    print(f"{count} Events gespeichert in '{path}'")
@@ -0,0 +1,59 @@
+# Liest alle Event-Karten einer Listenseite mit einem einzigen execute_script()-Aufruf aus.
+# Statt pro Event und Feld einen eigenen find_element()-Aufruf (je ein WebDriver-Roundtrip und
+# eine XPath-Auswertung über das ganze Dokument) zu machen, läuft die Extraktion komplett im Browser
+# und kommt als JSON-Liste zurück.
+import Snapshots
+import Tracing
+
+EXTRACT_SCRIPT = """
+const cardXpath = arguments[0];
+const fields = arguments[1];
+const cards = document.evaluate(cardXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const result = [];
+for (let i = 0; i < cards.snapshotLength; i++) {
+    const card = cards.snapshotItem(i);
+    const item = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        if (spec[2] !== null && spec[2] !== undefined) {
+            // Alle Treffer mit Trennzeichen verbinden
+            const nodes = document.evaluate(spec[0], card, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const parts = [];
+            for (let j = 0; j < nodes.snapshotLength; j++) {
+                const n = nodes.snapshotItem(j);
+                const value = (n.nodeType === Node.TEXT_NODE ? n.textContent : n.innerText).trim();
+                if (value) parts.push(value);
+            }
+            item[name] = parts.length ? parts.join(spec[2]) : null;
+            continue;
+        }
+        const node = document.evaluate(spec[0], card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (!node) {
+            item[name] = null;
+        } else if (spec[1]) {
+            item[name] = spec[1] === "href" && node.href ? node.href : node.getAttribute(spec[1]);
+        } else if (node.nodeType === Node.TEXT_NODE) {
+            item[name] = node.textContent.trim();
+        } else {
+            item[name] = node.innerText.trim();
+        }
+    }
+    result.push(item);
+}
+return result;
+"""
+
+
+def extract_cards(driver, card_xpath, fields):
+    """
+    Gibt für jede Karte (card_xpath) ein Dict mit allen Feldern zurück.
+    fields: {Name: (relativer XPath, Attribut oder None für den sichtbaren Text[, Trennzeichen])}
+    Mit Trennzeichen werden die Texte aller Treffer verbunden, sonst zählt nur der erste Treffer.
+    Nicht gefundene Felder sind None.
+    """
+    fields = {name: (list(spec) + [None, None])[:3] for name, spec in fields.items()}
+    with Tracing.span("extract_cards"):
+        cards = driver.execute_script(EXTRACT_SCRIPT, card_xpath, fields)
+    if Snapshots.REPLAYING:
+        # Links zeigen auf den lokalen Snapshot-Server, wieder auf die Original-URL umstellen
+        cards = [{name: Snapshots.restore(value) for name, value in card.items()} for card in cards]
+    return cards
@@ -0,0 +1,237 @@
+# Benchmark der ganzen Pipeline: Scrapen -> Datumsformatierung -> Upload nach Notion.
+# Die Websites laufen gegen aufgenommene Snapshots (Snapshots.py, vorher einmal mit SNAPSHOT_MODE=record
+# python event-scraper.py aufnehmen), der Upload gegen einen lokalen Notion-Mock. So sind die Zeiten
+# zwischen zwei Versionen vergleichbar, ohne eine echte Website oder Notion anzufassen.
+#
+# Pro Stufe (und pro Website) werden Laufzeit, Seiten/s, Events/s und der höchste RSS
+# (Python + Worker + Chrome) gemessen und als JSON gespeichert:
+#   python Benchmark.py --output benchmark.json
+#   python Benchmark.py --sites tum,luma --baseline benchmark.json
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Abweichungen, ab denen eine Kennzahl als Regression gilt (relativ zur Baseline)
+DEFAULT_TOLERANCE = 0.10
+# Kennzahlen, bei denen ein höherer Wert schlechter ist
+LOWER_IS_BETTER = ["wall_s", "peak_rss_mb"]
+HIGHER_IS_BETTER = ["pages_per_s", "events_per_s"]
+
+
+class PeakRss:
+    """Misst im Hintergrund den höchsten RSS dieses Prozesses samt aller Unterprozesse."""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak_mb = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def sample(self):
+        from DriverPool import process_tree_rss_mb
+        while True:
+            self.peak_mb = max(self.peak_mb, process_tree_rss_mb(os.getpid()))
+            if self.stop_event.wait(self.interval):
+                break
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+
+
+class NotionMock:
+    """Lokaler Ersatz für die Notion-API: leere Datenbank, jede neue Page wird angenommen."""
+
+    def __init__(self):
+        self.requests = 0
+        self.pages = 0
+        self.lock = threading.Lock()
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with mock.lock:
+                    mock.requests += 1
+                    if self.path.rstrip("/").endswith("/pages"):
+                        mock.pages += 1
+                        body = {"object": "page", "id": f"mock-{mock.pages}"}
+                    else:
+                        body = {"object": "list", "results": [], "has_more": False, "next_cursor": None}
+                content = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def measure(name, run):
+    """
+    Führt run() aus und gibt (Ergebnis, Kennzahlen) zurück.
+    run gibt (ergebnis, seiten, events) zurück.
+    """
+    print(f"⏱️ Benchmark: {name} ...")
+    with PeakRss() as rss:
+        start = time.perf_counter()
+        result, pages, events = run()
+        wall = time.perf_counter() - start
+    metrics = {
+        "wall_s": round(wall, 3),
+        "pages": pages,
+        "pages_per_s": round(pages / wall, 3) if wall > 0 else 0,
+        "events": events,
+        "events_per_s": round(events / wall, 3) if wall > 0 else 0,
+        "peak_rss_mb": round(rss.peak_mb, 1),
+    }
+    print(f"   {name}: {metrics['wall_s']:.2f}s, {pages} Seiten ({metrics['pages_per_s']:.1f}/s), "
+          f"{events} Events ({metrics['events_per_s']:.1f}/s), max. {metrics['peak_rss_mb']:.0f} MB RSS")
+    return result, metrics
+
+
+def run_benchmark(site_names):
+    # Erst nach dem Setzen von SNAPSHOT_MODE/SNAPSHOT_DIR importieren, die Module lesen die Umgebung beim Import
+    import Orchestrator
+    import Snapshots
+    from SiteRegistry import registry
+
+    sites = registry.select(site_names)
+    Snapshots.start_replay_servers()
+    stages = {}
+
+    # 1. Scrapen, Website für Website nacheinander (vergleichbare Zeiten ohne Konkurrenz um CPU)
+    def scrape_all():
+        all_events = []
+        total_pages = 0
+        for name, module_path in sites:
+            def scrape_site():
+                before = Snapshots.served_counts()["pages"]
+                events, _, _ = Orchestrator.run_site(name, module_path)
+                pages = Snapshots.served_counts()["pages"] - before
+                return events, pages, len(events)
+            events, stages[f"scrape:{name}"] = measure(f"scrape:{name}", scrape_site)
+            total_pages += stages[f"scrape:{name}"]["pages"]
+            all_events.extend(events)
+        return all_events, total_pages, len(all_events)
+
+    events, stages["scrape"] = measure("scrape", scrape_all)
+
+    # 2. Datumsformatierung
+    import Datumsformatierung
+
+    def normalize():
+        formatted = Datumsformatierung.process_events([dict(event) for event in events])
+        return formatted, 0, len(formatted)
+
+    formatted, stages["normalize"] = measure("normalize", normalize)
+
+    # 3. Abgleich und Upload nach Notion gegen den lokalen Mock
+    import NotionAPI
+
+    def upload():
+        mock = NotionMock()
+        NotionAPI.NOTION_API_URL = mock.url
+        try:
+            NotionAPI.upload_events(NotionAPI.filter_new_events(formatted))
+        finally:
+            mock.close()
+        return None, mock.requests, mock.pages
+
+    _, stages["upload"] = measure("upload", upload)
+
+    Snapshots.stop_replay_servers()
+    return stages
+
+
+def compare(stages, baseline, tolerance):
+    """Vergleicht mit einer Baseline; gibt die Liste der Regressionen zurück."""
+    regressions = []
+    print(f"📊 Vergleich mit Baseline vom {baseline.get('timestamp', '?')} (Toleranz {tolerance:.0%}):")
+    for stage, metrics in stages.items():
+        old = baseline.get("stages", {}).get(stage)
+        if not old:
+            print(f"   {stage}: nicht in der Baseline")
+            continue
+        parts = []
+        for key in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            if not old.get(key):
+                continue
+            change = (metrics[key] - old[key]) / old[key]
+            worse = change > tolerance if key in LOWER_IS_BETTER else change < -tolerance
+            if worse:
+                regressions.append(f"{stage} {key}: {old[key]} -> {metrics[key]} ({change:+.0%})")
+            parts.append(f"{key} {change:+.0%}{' ❌' if worse else ''}")
+        print(f"   {stage}: {', '.join(parts)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Scrapen -> Datumsformatierung -> Notion-Upload gegen Snapshots.")
+    parser.add_argument("--sites", help="Kommagetrennte Auswahl wie bei event-scraper.py (Standard: alle)")
+    parser.add_argument("--snapshots", default=os.path.join(HERE, "snapshots"), help="Snapshot-Verzeichnis")
+    parser.add_argument("--output", default="benchmark.json", help="Ergebnisdatei (JSON)")
+    parser.add_argument("--baseline", help="Frühere Ergebnisdatei zum Vergleich")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Erlaubte Verschlechterung (0.1 = 10%%)")
+    args = parser.parse_args()
+
+    os.environ["SNAPSHOT_MODE"] = "replay"
+    os.environ["SNAPSHOT_DIR"] = os.path.abspath(args.snapshots)
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    # Alle Dateien, die die Pipeline schreibt (z. B. notion_failed_events.csv), in einem temporären Verzeichnis
+    workdir = tempfile.mkdtemp(prefix="benchmark-")
+    previous_dir = os.getcwd()
+    os.chdir(workdir)
+    try:
+        stages = run_benchmark(args.sites.split(",") if args.sites else None)
+    finally:
+        os.chdir(previous_dir)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "sites": args.sites or "alle",
+        "stages": stages,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"✅ Ergebnisse gespeichert in {output}")
+
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            regressions = compare(stages, json.load(f), args.tolerance)
+        if regressions:
+            print("❌ Regressionen:\n   " + "\n   ".join(regressions))
+            sys.exit(1)
+        print("✅ Keine Regression gegenüber der Baseline")
+
+
+if __name__ == "__main__":
+    main()
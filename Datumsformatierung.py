@@ -3,8 +3,10 @@ from datetime import datetime, timezone
 from dateutil import parser
 from dateutil.tz import gettz
 import dateutil.parser
-import pandas as pd
-import os
+
+import Artifacts
+import Dedup
+import Tracing
 
 DEBUG = True
 
@@ -413,6 +415,13 @@ def try_fallback_date_parse(date_str):
     return date_str
 
 
+# ISO8601-Datum mit optionaler Uhrzeit und Zeitzone, z. B. "2025-05-14T18:30+02:00"
+ISO_DATE = r'\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2})?(Z|[+-]\d{2}:\d{2})?)?'
+
+def is_iso_date(date_str):
+    """Prüft, ob ein Datum (oder "start - end") bereits im ISO8601-Format vorliegt, z. B. aus StructuredData.py."""
+    return re.fullmatch(rf'{ISO_DATE}( - {ISO_DATE})?', date_str.strip()) is not None
+
 def parse_event_date(date_str, org=None):
     """
     Parst den Datum-String eines Events und gibt ihn im ISO8601-Format zurück.
@@ -420,6 +429,9 @@ def parse_event_date(date_str, org=None):
     wird der String als Bereich interpretiert.
     """
     debug_print("parse_event_date input:", date_str, "Org:", org)
+    if is_iso_date(date_str):
+        debug_print("parse_event_date: bereits ISO8601, keine Umwandlung nötig")
+        return date_str.strip()
     date_str = date_str.replace("Uhr", "").replace("·", " ").strip()
     if "-" in date_str or "-" in date_str or "@" in date_str:
         result = parse_date_range(date_str, org)
@@ -444,32 +456,24 @@ def process_events(events):
     """
     debug_print("process_events: Starting processing", len(events), "events")
     for event in events:
-        if "Datum" in event and event["Datum"]:
-            org = event.get("Organisation")
-            original_date = event["Datum"]
-            event["Datum"] = parse_event_date(event["Datum"], org)
-            debug_print("Processed event date:", original_date, "->", event["Datum"])
+        process_event(event)
     return events
 
+def process_event(event):
+    """Parst und formatiert das "Datum"-Feld eines einzelnen Events (für die Streaming-Pipeline)."""
+    if "Datum" in event and event["Datum"]:
+        org = event.get("Organisation")
+        original_date = event["Datum"]
+        with Tracing.span("parse_date", site=org, event=event.get("Titel")):
+            event["Datum"] = parse_event_date(event["Datum"], org)
+        debug_print("Processed event date:", original_date, "->", event["Datum"])
+    return event
+
 if __name__ == '__main__':
-    df = pd.read_excel("scraped_events.xlsx")
-    events = df.to_dict(orient="records")
+    # Zwischenstand von event-scraper.py lesen (Artifacts.py), Excel nur noch auf Wunsch über --excel
+    events = Artifacts.read_events(Artifacts.SCRAPED_PATH)
     events = process_events(events)
-    new_df = pd.DataFrame(events)
-    new_df.to_excel("scraped_events_formatted.xlsx", index=False)
-    print("Die Datei 'scraped_events_formatted.xlsx' wurde erstellt.")
-    # --- In CSV speichern ---
-    new_df.to_csv("scraped_events_formatted.csv", index=False, encoding="utf-8")
-    print("Die Datei 'scraped_events_formatted.csv' wurde erstellt.")
-
-# Optional: Dateien löschen
-files_to_delete = ["scraped_events.csv", "scraped_events.xlsx"]
-
-for file in files_to_delete:
-    try:
-        os.remove(file)
-        print(f"🗑️ Datei gelöscht: {file}")
-    except FileNotFoundError:
-        print(f"⚠️ Datei nicht gefunden: {file}")
-    except Exception as e:
-        print(f"❌ Fehler beim Löschen von {file}: {e}")
\ No newline at end of file
+    events = list(Dedup.DedupIndex().filter(events))
+    Artifacts.write_events(events, Artifacts.FORMATTED_PATH)
+    # Eigener Trace für den Einzellauf (Tracing.py)
+    Tracing.export_script("Datumsformatierung")
@@ -0,0 +1,122 @@
+# Duplikaterkennung über einen kompakten Fingerprint normierter Felder:
+#   kanonischer Link (SeenStore.canonical_link) + Titel (casefold, Leerraum zusammengefasst) + Startdatum
+# Unterschiede in Beschreibung, Leerzeichen oder Tracking-Parametern machen so kein zweites Event mehr.
+# Die Fingerprints (8 Byte BLAKE2b) werden in einer SQLite-Datei über Läufe hinweg gehalten; am Ende
+# eines Laufs wird ausgegeben, wie viele Events doppelt im Lauf waren und wie viele schon aus früheren
+# Läufen bekannt sind. Der Abgleich läuft gegen ein Set im Speicher und kann direkt in der
+# Streaming-Pipeline (Pipeline.dedup) sitzen; die Datei wird nur einmal gelesen und einmal geschrieben.
+# Die Datei wird vom Workflow zusammen mit den anderen Ergebnissen ins Repo committed.
+import hashlib
+import os
+import re
+import sqlite3
+import time
+
+from SeenStore import canonical_link
+
+# Bei Aufnahme/Wiedergabe (Snapshots.py) nur innerhalb des Laufs abgleichen, nichts speichern
+PERSIST = os.getenv("DEDUP_INDEX", "1") != "0" and not os.getenv("SNAPSHOT_MODE")
+DB_PATH = os.getenv("DEDUP_DB", "dedup_index.sqlite")
+# Events aus früheren Läufen ebenfalls aussortieren (Standard: nur zählen, der Notion-Abgleich entscheidet)
+SKIP_KNOWN = os.getenv("DEDUP_SKIP_KNOWN", "0") == "1"
+# Fingerprints, die so lange nicht mehr gesehen wurden, werden gelöscht
+KEEP_DAYS = float(os.getenv("DEDUP_KEEP_DAYS", "365"))
+
+ISO_START = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _text(value):
+    if value is None or value != value:    # None oder NaN
+        return ""
+    return " ".join(str(value).split()).casefold()
+
+
+def start_date(value):
+    """Startdatum (YYYY-MM-DD) aus dem von Datumsformatierung.py formatierten Datum, sonst der normierte Text."""
+    text = _text(value)
+    match = ISO_START.match(text)
+    return match.group(0) if match else text
+
+
+def fingerprint(event):
+    """8-Byte-Hash über kanonischen Link, normierten Titel und Startdatum."""
+    link = str(event.get("Link") or "").strip()
+    if link.startswith("http"):
+        link = canonical_link(link)
+    content = "\x1f".join([link, _text(event.get("Titel")), start_date(event.get("Datum"))])
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+
+
+class DedupIndex:
+    def __init__(self, path=DB_PATH, persist=PERSIST, skip_known=SKIP_KNOWN):
+        self.path = path
+        self.persist = persist
+        self.skip_known = skip_known
+        self.known = None       # Fingerprints aus früheren Läufen
+        self.seen = set()       # Fingerprints dieses Laufs
+        self.stats = {"events": 0, "duplicates": 0, "known": 0}
+
+    def _load(self):
+        self.known = set()
+        if not self.persist or not os.path.exists(self.path):
+            return
+        with sqlite3.connect(self.path, timeout=30) as connection:
+            self._create(connection)
+            self.known = {row[0] for row in connection.execute("SELECT hash FROM fingerprints")}
+
+    @staticmethod
+    def _create(connection):
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                hash BLOB PRIMARY KEY,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+
+    def _save(self):
+        now = time.time()
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            self._create(connection)
+            connection.executemany(
+                "INSERT INTO fingerprints (hash, first_seen, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET last_seen = excluded.last_seen",
+                [(key, now, now) for key in self.seen],
+            )
+            connection.execute("DELETE FROM fingerprints WHERE last_seen < ?", (now - KEEP_DAYS * 86400,))
+            connection.commit()
+        finally:
+            connection.close()
+
+    def filter(self, events):
+        """Lässt jedes Event nur einmal durch; speichert die Fingerprints am Ende des Laufs."""
+        if self.known is None:
+            self._load()
+        try:
+            for event in events:
+                self.stats["events"] += 1
+                key = fingerprint(event)
+                if key in self.seen:
+                    self.stats["duplicates"] += 1
+                    continue
+                self.seen.add(key)
+                if key in self.known:
+                    self.stats["known"] += 1
+                    if self.skip_known:
+                        continue
+                yield event
+        finally:
+            if self.persist and self.seen:
+                self._save()
+            self.report()
+
+    def report(self):
+        total = self.stats["events"]
+        if not total:
+            return
+        unique = total - self.stats["duplicates"]
+        print(f"♻️ Duplikate: {self.stats['duplicates']} von {total} Events im Lauf "
+              f"({self.stats['duplicates'] / total:.0%}), {self.stats['known']} von {unique} "
+              f"aus früheren Läufen bekannt ({self.stats['known'] / unique:.0%})"
+              f"{' und aussortiert' if self.skip_known else ''}")
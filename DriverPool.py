@@ -0,0 +1,323 @@
+# Pool wiederverwendbarer Chrome-Sessions für alle Websites.
+# Statt pro scrape() ein neues Chrome zu starten, leihen sich die Scraper eine warme Session aus
+# und geben sie danach zurück. Die Session wird dabei zurückgesetzt (Cookies, Tabs, Storage)
+# und nach zu vielen Seitenaufrufen bzw. zu hohem Speicherverbrauch neu gestartet.
+import base64
+import json
+import os
+import threading
+from multiprocessing import util
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+import Snapshots
+import Tracing
+
+# Session nach so vielen Seitenaufrufen neu starten
+MAX_PAGE_LOADS = int(os.getenv("DRIVER_MAX_PAGE_LOADS", "150"))
+# Session neu starten, wenn Chrome (inkl. Unterprozesse) mehr RAM belegt (in MB)
+MAX_RSS_MB = int(os.getenv("DRIVER_MAX_RSS_MB", "1500"))
+# Bilder, Schriften, Medien und Tracker blockieren (abschalten mit BLOCK_RESOURCES=0)
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "1") != "0"
+
+# Ressourcen, die keine Website je ausliest
+BLOCKED_URL_PATTERNS = [
+    # Bilder
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    # Schriften
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Video/Audio
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg",
+    # Analytics/Tracker
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*connect.facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*",
+    "*snap.licdn.com*", "*px.ads.linkedin.com*", "*segment.io*", "*segment.com*",
+    "*mixpanel.com*", "*amplitude.com*", "*fullstory.com*", "*matomo*", "*piwik*",
+]
+
+
+def build_options(network_log=False):
+    """Gemeinsame Chrome-Optionen für alle Websites; network_log schreibt das Performance-Log mit."""
+    options = Options()
+    options.add_argument("--headless")              # Kein GUI
+    options.add_argument("--disable-gpu")           # Für Kompatibilität
+    options.add_argument("--window-size=1920,1080") # Optional für konsistentes Verhalten
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    chrome_path = os.getenv("CHROME_BIN")
+    if chrome_path:
+        options.binary_location = chrome_path
+
+    if BLOCK_RESOURCES:
+        # Nicht auf Bilder, Schriften und Tracker warten, sobald das DOM steht geht es weiter
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+
+    if network_log:
+        # Antworten für json_responses() und Snapshots.capture() mitschreiben
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if Snapshots.REPLAYING:
+        # Nur die lokalen Snapshot-Server sind erreichbar, alles andere schlägt sofort fehl
+        options.add_argument("--host-resolver-rules=MAP * ~NOTFOUND , EXCLUDE 127.0.0.1")
+    return options
+
+
+def origin(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def block_resources(driver):
+    """Blockiert Bilder, Schriften, Medien und Tracker per CDP für den aktuellen Tab."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"⚠️ Ressourcen-Blockierung nicht aktiv: {e}")
+
+
+def process_tree_rss_mb(pid):
+    """Summiert den RSS eines Prozesses und aller Unterprozesse (Linux, über /proc)."""
+    total_kb = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+            for tid in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{tid}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+class PooledDriver:
+    """Hülle um einen Chrome-WebDriver, die Seitenaufrufe und Ausleihen mitzählt."""
+
+    def __init__(self, session_id, options, network_log=False):
+        driver_path = os.getenv("CHROMEDRIVER_PATH")
+        if driver_path and os.path.exists(driver_path):
+            self.driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        else:
+            self.driver = webdriver.Chrome(options=options)
+        if BLOCK_RESOURCES:
+            block_resources(self.driver)
+        self.session_id = session_id
+        # Nur Sessions, die mit Performance-Log gestartet wurden, schreiben Netzwerk-Antworten mit
+        self.network_logging = network_log
+        self.page_loads = 0
+        self.borrows = 0
+        self.origins = set()     # Aufgerufene Origins seit dem letzten Zurücksetzen
+
+    def get(self, url):
+        self.page_loads += 1
+        # Log der vorherigen Seite leeren (Aufnahme: Antworten sichern, bevor Chrome sie verwirft)
+        self.network_log()
+        url = Snapshots.rewrite(url)
+        self.origins.add(origin(url))
+        return self.driver.get(url)
+
+    def network_log(self):
+        """Performance-Log-Einträge seit dem letzten Aufruf bzw. Seitenwechsel."""
+        if not self.network_logging:
+            return []
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return []
+        Snapshots.capture(self.driver, entries)
+        return entries
+
+    def json_responses(self, url_contains=None):
+        """
+        Alle JSON-Antworten (XHR/Fetch) seit dem letzten Seitenwechsel als Liste von (URL, Daten).
+        So lassen sich die Daten, die eine Single-Page-App von ihrem Backend lädt, direkt auslesen.
+        """
+        responses = []
+        for entry in self.network_log():
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") != "Network.responseReceived":
+                continue
+            params = message["params"]
+            response = params["response"]
+            url = Snapshots.restore(response["url"])
+            if params.get("type") not in ("XHR", "Fetch") or response.get("status") != 200:
+                continue
+            if "json" not in (response.get("mimeType") or "") or (url_contains and url_contains not in url):
+                continue
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+                content = base64.b64decode(body["body"]) if body.get("base64Encoded") else body["body"]
+                responses.append((url, json.loads(content)))
+            except Exception:
+                continue
+        return responses
+
+    def find_element(self, by, value=None):
+        with Tracing.span("find_element"):
+            return self.driver.find_element(by, value)
+
+    def find_elements(self, by, value=None):
+        with Tracing.span("find_element"):
+            return self.driver.find_elements(by, value)
+
+    @property
+    def current_url(self):
+        return Snapshots.restore(self.driver.current_url)
+
+    def rss_mb(self):
+        try:
+            return process_tree_rss_mb(self.driver.service.process.pid)
+        except Exception:
+            return 0
+
+    def __getattr__(self, name):
+        # Alles andere (find_element, execute_script, current_url, ...) direkt an den WebDriver
+        return getattr(self.driver, name)
+
+
+class DriverPool:
+    def __init__(self, max_page_loads=MAX_PAGE_LOADS, max_rss_mb=MAX_RSS_MB):
+        self.max_page_loads = max_page_loads
+        self.max_rss_mb = max_rss_mb
+        self.idle = []
+        self.sessions = []
+        self.log = []            # ("launch" | "reuse", session_id) seit dem letzten drain_stats()
+        self.launch_count = 0
+        self.lock = threading.Lock()
+        self.finalizer = None
+
+    def acquire(self, network_log=False):
+        """
+        Gibt eine warme Session zurück oder startet ein neues Chrome, falls keine frei ist.
+        network_log=True: Session mit Performance-Log, z. B. für PooledDriver.json_responses() (AppliedAI).
+        Beim Aufnehmen von Snapshots schreiben alle Sessions das Log mit.
+        """
+        network_log = network_log or Snapshots.RECORDING
+        with self.lock:
+            session = self._pop_idle(network_log)
+            if session is None:
+                self.launch_count += 1
+                session_id = f"{os.getpid()}-{self.launch_count}"
+        if session is None:
+            session = PooledDriver(session_id, build_options(network_log), network_log)
+            with self.lock:
+                self.sessions.append(session)
+                self.log.append(("launch", session.session_id))
+                if self.finalizer is None:
+                    # Beim Beenden des (Worker-)Prozesses alle Chrome-Instanzen schließen
+                    self.finalizer = util.Finalize(self, DriverPool.close_all, args=(self,), exitpriority=10)
+        else:
+            with self.lock:
+                self.log.append(("reuse", session.session_id))
+        session.borrows += 1
+        return session
+
+    def _pop_idle(self, network_log):
+        # Bevorzugt eine Session mit passender Einstellung; ohne Log tut es auch eine mit Log,
+        # deren Log beim Zurückgeben geleert wird. Für ein Log wird sonst ein neues Chrome gestartet.
+        for position in range(len(self.idle) - 1, -1, -1):
+            if self.idle[position].network_logging == network_log:
+                return self.idle.pop(position)
+        if not network_log and self.idle:
+            return self.idle.pop()
+        return None
+
+    def release(self, session):
+        """Nimmt eine Session zurück, setzt sie zurück oder startet sie bei Bedarf neu."""
+        session.network_log()
+        if session.page_loads >= self.max_page_loads:
+            print(f"♻️ Chrome-Session {session.session_id} nach {session.page_loads} Seitenaufrufen recycelt")
+            self._discard(session)
+            return
+        rss = session.rss_mb()
+        if rss >= self.max_rss_mb:
+            print(f"♻️ Chrome-Session {session.session_id} bei {rss:.0f} MB RSS recycelt")
+            self._discard(session)
+            return
+        try:
+            self._reset(session)
+        except Exception as e:
+            print(f"⚠️ Chrome-Session {session.session_id} konnte nicht zurückgesetzt werden: {e}")
+            self._discard(session)
+            return
+        with self.lock:
+            self.idle.append(session)
+
+    def _reset(self, session):
+        # Zusätzliche Tabs schließen
+        handles = session.window_handles
+        for handle in handles[1:]:
+            session.switch_to.window(handle)
+            session.close()
+        session.switch_to.window(handles[0])
+        session.origins.add(origin(session.driver.current_url))
+        # Frischer Tab ohne sessionStorage, der alte wird geschlossen
+        session.switch_to.new_window("tab")
+        fresh = session.current_window_handle
+        session.switch_to.window(handles[0])
+        session.close()
+        session.switch_to.window(fresh)
+        if BLOCK_RESOURCES:
+            # Die Blockierung gilt pro Tab
+            block_resources(session.driver)
+        # Cookies aller Hosts (auch Consent-Cookies von Drittanbietern) und Storage aller besuchten Origins
+        # per CDP löschen – delete_all_cookies() und localStorage.clear() erreichen nur die aktuelle Seite
+        session.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for visited in sorted(o for o in session.origins if o.startswith("http")):
+            session.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": visited, "storageTypes": "all"})
+        session.origins = set()
+        try:
+            # Storage eingebetteter Drittanbieter-Frames (nicht jede Chrome-Version kennt "*")
+            session.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+        except Exception:
+            pass
+
+    def _discard(self, session):
+        with self.lock:
+            if session in self.sessions:
+                self.sessions.remove(session)
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        with self.lock:
+            sessions, self.sessions, self.idle = self.sessions, [], []
+        for session in sessions:
+            try:
+                session.driver.quit()
+            except Exception:
+                pass
+
+    def drain_stats(self):
+        """Gibt die Starts/Wiederverwendungen seit dem letzten Aufruf und den Stand jeder Session zurück."""
+        with self.lock:
+            log, self.log = self.log, []
+            session_ids = {session_id for _, session_id in log}
+            sessions = [
+                {"session": s.session_id, "borrows": s.borrows, "page_loads": s.page_loads}
+                for s in self.sessions if s.session_id in session_ids
+            ]
+        return {
+            "launches": sum(1 for kind, _ in log if kind == "launch"),
+            "reuses": sum(1 for kind, _ in log if kind == "reuse"),
+            "sessions": sessions,
+        }
+
+
+# Ein Pool pro Prozess; Chrome wird erst beim ersten acquire() gestartet
+driver_pool = DriverPool()
@@ -0,0 +1,164 @@
+# Festplatten-Cache für geladene Seiten (Übersichts- und Detailseiten).
+# Ein erneuter Lauf, z. B. nach einem Absturz in Datumsformatierung.py oder NotionAPI.py, lädt nichts neu,
+# solange die Einträge frisch sind. Abgelaufene Einträge werden per ETag/Last-Modified beim Server
+# nachgefragt (304 = unverändert, kein erneuter Download).
+# Die Inhalte liegen inhaltsadressiert (SHA-256) unter HTTP_CACHE_DIR/objects, der Index (URL -> Inhalt,
+# Validatoren, Zeitstempel) in HTTP_CACHE_DIR/index.sqlite. Wird HTTP_CACHE_MAX_MB überschritten,
+# fliegen die am längsten nicht benutzten Einträge raus (LRU).
+# Neben den rohen HTTP-Antworten speichert der Selenium-Pfad das gerenderte DOM ("rendered"), damit
+# auch Seiten, die Chrome brauchen, beim nächsten Lauf ohne Browser ausgewertet werden können.
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Abschalten mit HTTP_CACHE=0; bei Aufnahme/Wiedergabe (Snapshots.py) immer aus
+ENABLED = os.getenv("HTTP_CACHE", "1") != "0" and not os.getenv("SNAPSHOT_MODE")
+CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".http_cache")
+# Standard-Lebensdauer eines Eintrags in Sekunden
+DEFAULT_TTL = float(os.getenv("HTTP_CACHE_TTL", str(6 * 3600)))
+MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "200"))
+
+# Lebensdauer pro Website (Host); Plattformen, deren Seiten sich oft ändern, kürzer
+SITE_TTLS = {
+    "lu.ma": 3600,
+    "api.lu.ma": 3600,
+    "www.eventbrite.de": 3600,
+    "community.appliedai.de": 3600,
+}
+
+
+def ttl_for(url):
+    return SITE_TTLS.get(urlsplit(url).netloc.lower(), DEFAULT_TTL)
+
+
+class HttpCache:
+    def __init__(self, directory=CACHE_DIR, max_mb=MAX_MB):
+        self.directory = directory
+        self.max_bytes = max_mb * 1024 * 1024
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def _connect(self):
+        if self.connection is None:
+            os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+            # Mehrere Worker-Prozesse teilen sich den Index, daher mit Wartezeit auf Sperren
+            self.connection = sqlite3.connect(os.path.join(self.directory, "index.sqlite"), timeout=30, check_same_thread=False)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    kind TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (kind, url)
+                )
+            """)
+            self.connection.commit()
+        return self.connection
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def _read(self, digest):
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                return f.read().decode("utf-8")
+        except OSError:
+            return None
+
+    def _write(self, content):
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        return digest, len(data)
+
+    def lookup(self, url, kind="http"):
+        """
+        Gibt (content, fresh, etag, last_modified) zurück oder None, wenn die URL nicht im Cache ist.
+        fresh ist False, wenn der Eintrag älter als die TTL der Website ist.
+        """
+        if not ENABLED:
+            return None
+        with self.lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT digest, etag, last_modified, fetched_at FROM entries WHERE kind = ? AND url = ?", (kind, url)
+            ).fetchone()
+            if row is None:
+                return None
+            content = self._read(row[0])
+            if content is None:
+                connection.execute("DELETE FROM entries WHERE kind = ? AND url = ?", (kind, url))
+                connection.commit()
+                return None
+            connection.execute("UPDATE entries SET last_access = ? WHERE kind = ? AND url = ?", (time.time(), kind, url))
+            connection.commit()
+        fresh = time.time() - row[3] < ttl_for(url)
+        return content, fresh, row[1], row[2]
+
+    def get(self, url, kind="http"):
+        """Inhalt eines frischen Eintrags oder None."""
+        entry = self.lookup(url, kind)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def store(self, url, content, etag=None, last_modified=None, kind="http"):
+        if not ENABLED or content is None:
+            return
+        with self.lock:
+            connection = self._connect()
+            digest, size = self._write(content)
+            now = time.time()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (kind, url, digest, size, etag, last_modified, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, url, digest, size, etag, last_modified, now, now),
+            )
+            connection.commit()
+            self._evict(connection)
+
+    def touch(self, url, kind="http"):
+        """Eintrag wieder als frisch markieren (Server hat 304 Not Modified geantwortet)."""
+        with self.lock:
+            connection = self._connect()
+            now = time.time()
+            connection.execute("UPDATE entries SET fetched_at = ?, last_access = ? WHERE kind = ? AND url = ?", (now, now, kind, url))
+            connection.commit()
+
+    def _evict(self, connection):
+        # Größe der referenzierten Inhalte (gleiche Inhalte liegen nur einmal auf der Platte)
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM entries)").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        removed = 0
+        for kind, url, digest in connection.execute("SELECT kind, url, digest FROM entries ORDER BY last_access").fetchall():
+            if total <= self.max_bytes * 0.9:
+                break
+            connection.execute("DELETE FROM entries WHERE kind = ? AND url = ?", (kind, url))
+            removed += 1
+            # Inhalt nur löschen, wenn kein anderer Eintrag darauf zeigt
+            if connection.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+                try:
+                    total -= os.path.getsize(self._object_path(digest))
+                    os.remove(self._object_path(digest))
+                except OSError:
+                    pass
+        connection.commit()
+        print(f"🗑️ HTTP-Cache: {removed} alte Einträge entfernt")
+
+
+# Ein Cache pro Prozess; das Verzeichnis wird erst beim ersten Zugriff angelegt
+http_cache = HttpCache()
@@ -0,0 +1,213 @@
+# Schneller HTTP-Abruf (requests + lxml) für Websites, deren Seiten serverseitig gerendert werden.
+# Die Seiten werden über eine gemeinsame Session mit Connection-Pool geladen und mit lxml ausgewertet,
+# ganz ohne Browser. Liefert eine Seite keinen verwertbaren Inhalt, fallen die Scraper auf Selenium zurück.
+import asyncio
+import os
+import re
+from urllib.parse import urlsplit
+
+import requests
+from lxml import html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from HttpCache import http_cache
+from SeenStore import seen_store
+import Snapshots
+import Tracing
+
+# HTTP-Schnellpfad abschalten mit HTTP_FAST_PATH=0 (dann wird immer Selenium benutzt)
+FAST_PATH = os.getenv("HTTP_FAST_PATH", "1") != "0"
+TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+# Höchstens so viele gleichzeitige Anfragen pro Host
+PER_HOST = int(os.getenv("HTTP_PER_HOST", "4"))
+# Detailseiten in Blöcken dieser Größe laden, damit die ersten Events schon weitergereicht werden können
+STREAM_CHUNK = int(os.getenv("HTTP_STREAM_CHUNK", "32"))
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
+}
+
+session = requests.Session()
+session.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
+
+def fetch(url):
+    """
+    Lädt eine Seite und gibt den HTML-Text zurück (None bei Fehlern).
+    Frische Einträge kommen aus dem HttpCache, abgelaufene werden per ETag/Last-Modified nachgefragt.
+    """
+    with Tracing.span("http_fetch", event=url):
+        return _fetch(url)
+
+
+def _fetch(url):
+    entry = http_cache.lookup(url)
+    if entry and entry[1]:
+        return entry[0]
+
+    headers = {}
+    if entry and entry[2]:
+        headers["If-None-Match"] = entry[2]
+    if entry and entry[3]:
+        headers["If-Modified-Since"] = entry[3]
+    if Snapshots.REPLAYING:
+        headers[Snapshots.RAW_HEADER] = "1"
+    target = Snapshots.rewrite(url)
+    if Snapshots.REPLAYING and target == url:
+        # Host wurde nicht aufgenommen: offline bleiben wie Chrome im Wiedergabe-Modus
+        return None
+    try:
+        # Im Wiedergabe-Modus kommt die Seite vom lokalen Snapshot-Server
+        response = session.get(target, timeout=TIMEOUT, headers=headers)
+        if response.status_code == 304 and entry:
+            http_cache.touch(url)
+            return entry[0]
+        response.raise_for_status()
+        if Snapshots.RECORDING:
+            Snapshots.save(url, response.content, response.headers.get("Content-Type", "text/html; charset=utf-8"))
+        http_cache.store(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return response.text
+    except Exception as e:
+        if entry:
+            print(f"⚠️ HTTP-Abruf fehlgeschlagen für {url}, nehme die Version aus dem Cache: {e}")
+            return entry[0]
+        print(f"⚠️ HTTP-Abruf fehlgeschlagen für {url}: {e}")
+        return None
+
+
+def parse(content, url):
+    """Parst HTML mit lxml; relative Links werden gegen url aufgelöst."""
+    tree = html.fromstring(content, base_url=url)
+    tree.make_links_absolute(url, resolve_base_href=True)
+    return tree
+
+
+def fetch_tree(url):
+    """Lädt eine Seite und gibt den lxml-Baum zurück (None bei Fehlern oder leerer Seite)."""
+    content = fetch(url)
+    if not content or not content.strip():
+        return None
+    return parse(content, url)
+
+
+async def _fetch_all(urls, per_host):
+    semaphores = {}
+
+    async def fetch_one(url):
+        host = urlsplit(url).netloc
+        semaphore = semaphores.setdefault(host, asyncio.Semaphore(per_host))
+        async with semaphore:
+            # requests ist blockierend, daher im Thread-Pool der Event-Loop ausführen
+            return await asyncio.to_thread(fetch, url)
+
+    return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+
+def fetch_all(urls, per_host=PER_HOST):
+    """Lädt mehrere Seiten gleichzeitig (höchstens per_host je Host). Ergebnisse in der Reihenfolge von urls."""
+    urls = list(urls)
+    if not urls:
+        return []
+    return asyncio.run(_fetch_all(urls, per_host))
+
+
+def fetch_trees(urls, per_host=PER_HOST):
+    """Wie fetch_all(), gibt aber lxml-Bäume zurück (None bei Fehlern oder leerer Seite)."""
+    urls = list(urls)
+    return [
+        parse(content, url) if content and content.strip() else None
+        for url, content in zip(urls, fetch_all(urls, per_host))
+    ]
+
+
+def scrape_details(event_links, extract, per_host=PER_HOST):
+    """
+    Detail-Stufe für Scraper, die zuerst alle Links sammeln und dann jede Seite besuchen.
+    Lädt alle Detailseiten gleichzeitig und ruft extract(tree, link) für jede Seite auf.
+    extract gibt ein Event-Dict zurück oder None, wenn die Seite keinen verwertbaren Inhalt hat.
+    Bereits bekannte Links (SeenStore) werden nicht geladen, ihre gespeicherten Events kommen direkt zurück.
+    Rückgabe: (events, fallback_links) – fallback_links kann der Scraper mit Selenium nachladen.
+    """
+    events = []
+    iterator = iter_details(event_links, extract, per_host)
+    while True:
+        try:
+            events.append(next(iterator))
+        except StopIteration as stop:
+            return events, stop.value
+
+
+def iter_details(event_links, extract, per_host=PER_HOST, chunk_size=STREAM_CHUNK):
+    """
+    Wie scrape_details(), gibt die Events aber einzeln zurück, sobald ihr Block von chunk_size Seiten geladen ist.
+    Der Rückgabewert des Generators (fallback_links = yield from iter_details(...)) sind die Links für Selenium.
+    """
+    links = [link for link in event_links if link and link.startswith("http")]
+    for link in event_links:
+        if link not in links:
+            print(f"⚠️ Ungültiger Link wird übersprungen: {link}")
+    known_events, links = seen_store.split(links)
+    yield from known_events
+    if not FAST_PATH:
+        return links
+
+    found = 0
+    fallback_links = []
+    for offset in range(0, len(links), chunk_size):
+        chunk = links[offset:offset + chunk_size]
+        for link, tree in zip(chunk, fetch_trees(chunk, per_host)):
+            with Tracing.span("extract", event=link):
+                event = extract(tree, link) if tree is not None else None
+            if event is None:
+                fallback_links.append(link)
+            else:
+                found += 1
+                yield event
+    print(f"Detailseiten per HTTP: {found} verwertbar, {len(fallback_links)} für Selenium")
+    return fallback_links
+
+
+def has_class(name):
+    """XPath-Bedingung für ein Element mit der CSS-Klasse name (wie By.CLASS_NAME)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def clean(value):
+    """Mehrfache Leerzeichen/Zeilenumbrüche zusammenfassen, wie im gerenderten Text."""
+    return re.sub(r"\s+", " ", value).strip()
+
+
+def texts(element, xpath):
+    """Alle nicht-leeren Texte der Treffer eines XPaths."""
+    result = []
+    for match in element.xpath(xpath):
+        value = match if isinstance(match, str) else match.text_content()
+        value = clean(value)
+        if value:
+            result.append(value)
+    return result
+
+
+def text(element, xpath):
+    """Text des ersten Treffers eines XPaths (None, wenn nichts gefunden wurde)."""
+    matches = texts(element, xpath)
+    return matches[0] if matches else None
+
+
+def attr(element, xpath, name):
+    """Attribut des ersten Treffers eines XPaths (None, wenn nichts gefunden wurde)."""
+    for match in element.xpath(xpath):
+        value = match.get(name)
+        if value:
+            return value.strip()
+    return None
@@ -0,0 +1,109 @@
+# Adapter für lu.ma-Kalender über die öffentlichen JSON-Endpunkte von api.lu.ma.
+# Ein Kalender wird nur über seinen Handle angegeben (lu.ma/<handle>, z. B. "vlsa"):
+#   1. /url?url=<handle>                    -> api_id des Kalenders
+#   2. /calendar/get-items?period=future    -> alle kommenden Events (seitenweise über next_cursor)
+#   3. /event/get?event_api_id=...          -> Beschreibungen, alle Events gleichzeitig
+# Ein weiterer lu.ma-Veranstalter kostet damit ein paar Requests statt einer Browser-Session.
+#
+#   events = LumaCalendar.scrape("vlsa", "TUM Venture Labs")
+import json
+from urllib.parse import quote, urlsplit
+
+import HttpFetcher
+import StructuredData
+
+API_URL = "https://api.lu.ma"
+EVENT_URL = "https://lu.ma/"
+PAGE_LIMIT = 50
+# Obergrenze der Listenseiten, falls next_cursor nie endet
+MAX_PAGES = 20
+
+
+def handle_from_url(calendar_url):
+    """Handle aus einer Kalender-URL, z. B. https://lu.ma/vlsa?compact=true -> vlsa."""
+    return urlsplit(calendar_url).path.strip("/").split("/")[0]
+
+
+def _load(content):
+    try:
+        return json.loads(content) if content else None
+    except ValueError:
+        return None
+
+
+def calendar_id(handle):
+    """api_id des Kalenders ("cal-...") zu einem Handle, None wenn der Handle kein Kalender ist."""
+    data = _load(HttpFetcher.fetch(f"{API_URL}/url?url={quote(handle)}"))
+    if isinstance(data, dict) and data.get("kind") == "calendar":
+        return data.get("data", {}).get("calendar", {}).get("api_id")
+    # Sonst aus dem eingebetteten Seitenzustand der Kalenderseite
+    tree = HttpFetcher.fetch_tree(f"{EVENT_URL}{handle}")
+    state = StructuredData.next_data(tree) if tree is not None else None
+    for obj in StructuredData.iter_dicts(state or {}):
+        if str(obj.get("api_id", "")).startswith("cal-"):
+            return obj["api_id"]
+    return None
+
+
+def upcoming_events(calendar_api_id):
+    """Alle kommenden Events des Kalenders (Objekte aus get-items, Feld "event")."""
+    events = []
+    cursor = None
+    for _ in range(MAX_PAGES):
+        url = (f"{API_URL}/calendar/get-items?calendar_api_id={calendar_api_id}"
+               f"&period=future&pagination_limit={PAGE_LIMIT}")
+        if cursor:
+            url += f"&pagination_cursor={quote(cursor)}"
+        data = _load(HttpFetcher.fetch(url))
+        if not isinstance(data, dict):
+            break
+        events.extend(entry["event"] for entry in data.get("entries", []) if isinstance(entry.get("event"), dict))
+        cursor = data.get("next_cursor")
+        if not data.get("has_more") or not cursor:
+            break
+    return events
+
+
+def descriptions(event_ids):
+    """Beschreibungen aller Events, gleichzeitig geladen: {event_api_id: Text}."""
+    urls = [f"{API_URL}/event/get?event_api_id={event_id}" for event_id in event_ids]
+    texts = {}
+    for event_id, content in zip(event_ids, HttpFetcher.fetch_all(urls)):
+        data = _load(content)
+        if not isinstance(data, dict):
+            continue
+        mirror = data.get("description_mirror") or data.get("event", {}).get("description_mirror")
+        text = StructuredData.prosemirror_text(mirror).strip() if mirror else ""
+        if text:
+            texts[event_id] = text
+    return texts
+
+
+def to_event(event, organisation, description, max_length=2000, cut_at=1800):
+    description = StructuredData.truncate(description or "Keine Description gefunden", cut_at, max_length)
+    location = StructuredData.location_text(event.get("geo_address_info"))
+    if not location and event.get("location_type") == "online":
+        location = "Online"
+    return {
+        "Organisation": organisation,
+        "Titel": (event.get("name") or "").strip(),
+        "Datum": StructuredData.date_range(event.get("start_at"), event.get("end_at")),
+        "Location": location,
+        "Description": description,
+        "Link": EVENT_URL + event["url"] if event.get("url") else None,
+    }
+
+
+def scrape(handle, organisation):
+    """Alle kommenden Events eines lu.ma-Kalenders; None, wenn die API nicht erreichbar ist."""
+    if not HttpFetcher.FAST_PATH:
+        return None
+    calendar_api_id = calendar_id(handle)
+    if not calendar_api_id:
+        print(f"⚠️ lu.ma: Kalender '{handle}' nicht gefunden")
+        return None
+    events = upcoming_events(calendar_api_id)
+    texts = descriptions([event["api_id"] for event in events if event.get("api_id")])
+    print(f"{organisation}: {len(events)} Events über die lu.ma-API ({len(texts)} Beschreibungen)")
+    results = [to_event(event, organisation, texts.get(event.get("api_id"))) for event in events]
+    return [event for event in results if event["Titel"] and event["Datum"] and event["Link"]]
@@ -0,0 +1,179 @@
+# Erkennung fast gleicher Events über Plattformen hinweg (z. B. dasselbe Event von TUM Venture Labs auf
+# tum-venture-labs.de, Eventbrite, lu.ma und Munich Startup mit leicht anderem Titel).
+# Pro Event wird eine MinHash-Signatur über die Zeichen-3-Gramme des normierten Titels berechnet und mit
+# LSH (Bänder aus je ROWS Werten) in Buckets pro Starttag einsortiert. Nur Events, die in mindestens einem
+# Bucket zusammenfallen, werden über die geschätzte Jaccard-Ähnlichkeit verglichen – der Aufwand pro Event
+# bleibt damit auch bei zehntausenden Events praktisch konstant. Der Index gilt nur für einen Lauf;
+# über Läufe hinweg gleichen Dedup.py (gleiche Fingerprints) und der Notion-Abgleich ab.
+# Zusammengefasst werden nur Events aus verschiedenen Quellen (Organisation oder Link-Host) mit denselben
+# Zahlen im Titel – eine Reihe wie "Pitch Training Part 1/2" oder "AI Meetup #3/#4" bleibt getrennt.
+#
+#   collapse(events)  ganze Liste: pro Gruppe bleibt das Event mit den meisten Angaben (event-scraper.py)
+#   drop(events)      Generator für die Streaming-Pipeline: das zuerst gesehene Event bleibt
+import os
+import re
+import zlib
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from Dedup import start_date
+
+# Abschalten mit NEAR_DUP=0
+ENABLED = os.getenv("NEAR_DUP", "1") != "0"
+# Ab dieser geschätzten Jaccard-Ähnlichkeit der Titel gelten zwei Events am selben Tag als gleich
+THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.75"))
+
+BANDS = 20
+ROWS = 3
+NUM_PERM = BANDS * ROWS
+SHINGLE_SIZE = 3
+
+# Universelle Hashfunktionen (a * x + b) mod PRIME, fest geseedet, damit Signaturen reproduzierbar sind.
+# x < 2^32 und a < 2^32, das Produkt passt also in uint64.
+PRIME = np.uint64((1 << 31) - 1)
+_random = np.random.RandomState(42)
+_A = _random.randint(1, (1 << 31) - 1, size=NUM_PERM).astype(np.uint64)
+_B = _random.randint(0, (1 << 31) - 1, size=NUM_PERM).astype(np.uint64)
+
+_NON_WORD = re.compile(r"[\W_]+")
+_NUMBER = re.compile(r"\d+")
+
+RICHNESS_FIELDS = ["Titel", "Datum", "Location", "Description", "Link"]
+
+
+def normalize_title(title):
+    if title is None or title != title:    # None oder NaN
+        return ""
+    return " ".join(_NON_WORD.sub(" ", str(title).casefold()).split())
+
+
+def shingles(title):
+    text = normalize_title(title)
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def numbers(title):
+    """Zahlen im Titel (Teil, Nummer, Jahr), z. B. "AI Meetup #3" -> ("3",)."""
+    return tuple(sorted(_NUMBER.findall(normalize_title(title))))
+
+
+def source(event):
+    """Herkunft eines Events: (Organisation, Host des Links)."""
+    link = str(event.get("Link") or "")
+    host = urlsplit(link).netloc.lower() if link.startswith("http") else ""
+    return str(event.get("Organisation") or ""), host
+
+
+def signature(title):
+    """MinHash-Signatur (NUM_PERM Werte) der Titel-Shingles, None bei leerem Titel."""
+    values = shingles(title)
+    if not values:
+        return None
+    # Stabiler 32-Bit-Hash pro Shingle (hash() von str ist pro Prozess zufällig)
+    hashes = np.array([zlib.crc32(s.encode("utf-8")) for s in values], dtype=np.uint64)
+    return ((np.outer(hashes, _A) % PRIME + _B) % PRIME).min(axis=0)
+
+
+def similarity(first, second):
+    """Geschätzte Jaccard-Ähnlichkeit zweier Signaturen."""
+    return float(np.count_nonzero(first == second)) / NUM_PERM
+
+
+def richness(event):
+    """Wie vollständig ein Event ist: Anzahl gefüllter Felder, dann Länge der Beschreibung."""
+    filled = 0
+    for field in RICHNESS_FIELDS:
+        value = event.get(field)
+        if value is not None and value == value and str(value).strip():
+            filled += 1
+    description = event.get("Description")
+    length = len(str(description)) if description is not None and description == description else 0
+    return filled, length
+
+
+class NearDuplicateIndex:
+    def __init__(self, threshold=THRESHOLD):
+        self.threshold = threshold
+        self.buckets = {}       # (Starttag, Band, Bandwerte) -> Nummern der Gruppen
+        self.signatures = []    # Signatur des ersten Events jeder Gruppe
+        self.numbers = []       # Zahlen im Titel des ersten Events jeder Gruppe
+        self.sources = []       # Herkünfte (Organisation, Host) aller Events jeder Gruppe
+
+    def _new_group(self, sig, title_numbers, event_source):
+        self.signatures.append(sig)
+        self.numbers.append(title_numbers)
+        self.sources.append({event_source})
+        return len(self.signatures) - 1
+
+    def add(self, event):
+        """
+        Ordnet ein Event einer Gruppe zu.
+        Rückgabe: (Gruppennummer, neu) – neu ist True, wenn das Event eine neue Gruppe eröffnet.
+        """
+        sig = signature(event.get("Titel"))
+        title_numbers = numbers(event.get("Titel"))
+        event_source = source(event)
+        if sig is None:
+            return self._new_group(None, title_numbers, event_source), True
+        day = start_date(event.get("Datum"))
+        keys = [(day, band, sig[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+        checked = set()
+        for key in keys:
+            for group in self.buckets.get(key, ()):
+                if group in checked:
+                    continue
+                checked.add(group)
+                # Dieselbe Quelle listet jedes Event nur einmal, andere Zahlen sind ein anderer Termin
+                if event_source in self.sources[group] or title_numbers != self.numbers[group]:
+                    continue
+                if similarity(sig, self.signatures[group]) >= self.threshold:
+                    self.sources[group].add(event_source)
+                    return group, False
+
+        group = self._new_group(sig, title_numbers, event_source)
+        for key in keys:
+            self.buckets.setdefault(key, []).append(group)
+        return group, True
+
+
+def _report(total, kept):
+    if total:
+        print(f"♻️ {total - kept} fast gleiche Events (MinHash/LSH) zusammengefasst, {kept} bleiben")
+
+
+def collapse(events):
+    """Fasst fast gleiche Events zusammen und behält pro Gruppe das Event mit den meisten Angaben."""
+    if not ENABLED:
+        return events
+    index = NearDuplicateIndex()
+    best = {}
+    for position, event in enumerate(events):
+        group, _ = index.add(event)
+        if group not in best or richness(event) > richness(best[group][1]):
+            # Position des ersten Events der Gruppe behalten, damit die Reihenfolge stabil bleibt
+            best[group] = (best[group][0] if group in best else position, event)
+    kept = [event for _, event in sorted(best.values(), key=lambda item: item[0])]
+    _report(len(events), len(kept))
+    return kept
+
+
+def drop(events):
+    """Lässt pro Gruppe fast gleicher Events nur das erste durch (für die Streaming-Pipeline)."""
+    if not ENABLED:
+        yield from events
+        return
+    index = NearDuplicateIndex()
+    total = kept = 0
+    try:
+        for event in events:
+            total += 1
+            _, new = index.add(event)
+            if new:
+                kept += 1
+                yield event
+    finally:
+        _report(total, kept)
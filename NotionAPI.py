@@ -1,25 +1,21 @@
-try:
-    from dateutil import parser
-except ImportError:
-    import subprocess
-    import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "python-dateutil"])
-    from dateutil import parser
-
 import sys
-sys.stdout.reconfigure(encoding='utf-8')
 
 import pandas as pd
 import requests
 import time
 import os
 
+import Artifacts
+import Tracing
+
 FAILED_EVENTS = []       # Liste für fehlgeschlagene Uploads
 
 # === KONFIGURATION ===
 NOTION_TOKEN = os.getenv("SECRET_NotionToken")
 DATABASE_ID = os.getenv("SECRET_NotionDatabaseLink")
-CSV_PATH = "scraped_events_formatted.csv"  # Pfad zur CSV-Datei
+EVENTS_PATH = Artifacts.FORMATTED_PATH  # Parquet-Datei aus Datumsformatierung.py
+# Basis-URL der API (für Benchmarks gegen einen lokalen Mock überschreibbar)
+NOTION_API_URL = os.getenv("NOTION_API_URL", "https://api.notion.com/v1").rstrip("/")
 
 # === HEADER für Notion API ===
 headers = {
@@ -29,16 +25,20 @@ headers = {
 }
 
 def get_database_rows(database_id):
-    url = f"https://api.notion.com/v1/databases/{database_id}/query"
+    url = f"{NOTION_API_URL}/databases/{database_id}/query"
     rows = []
+    payload = {}
 
-    while url:
-        response = requests.post(url, headers=headers)
+    while True:
+        with Tracing.span("notion_query"):
+            response = requests.post(url, headers=headers, json=payload)
         data = response.json()
         rows.extend(data.get("results", []))
-        url = data.get("next_cursor")
-        if url:
-            time.sleep(0.3)
+        # Weitere Seiten über start_cursor abfragen (next_cursor ist keine URL)
+        if not data.get("has_more") or not data.get("next_cursor"):
+            break
+        payload = {"start_cursor": data["next_cursor"]}
+        time.sleep(0.3)
 
     return rows
 
@@ -78,26 +78,35 @@ def notion_to_csv(database_id, output_csv="notion_export.csv"):
     df.to_csv(output_csv, index=False, encoding="utf-8")
     print(f"✅ Exportiert nach {output_csv}")
 
-# Notion-Daten exportieren
-notion_to_csv(DATABASE_ID)
-
-# Dateien laden
-scraped = pd.read_csv("scraped_events_formatted.csv")
-notion = pd.read_csv("notion_export.csv")
+def normalize_link(link):
+    """Links trimmen und in Kleinbuchstaben, damit der Vergleich mit Notion funktioniert."""
+    return str(link).strip().lower()
 
-# Normieren der Links (trimmen und in Kleinbuchstaben, damit der Vergleich funktioniert)
-scraped["Link"] = scraped["Link"].astype(str).str.strip().str.lower()
-notion["Link"] = notion["Link"].astype(str).str.strip().str.lower()
-
-# Inner Merge → Zeilen, die sowohl in scraped als auch in notion vorkommen (basierend auf "Link")
-duplikate = pd.merge(scraped, notion, on=["Link"], how="inner")
-
-# Übrig bleiben nur Events, die nicht in Notion vorhanden sind (basierend auf "Link")
-bereinigt = scraped[~scraped.set_index("Link").index.isin(duplikate.set_index("Link").index)]
+def existing_links(database_id=None):
+    """Alle (normierten) Links, die schon in der Notion-Datenbank stehen."""
+    rows = get_database_rows(database_id or DATABASE_ID)
+    return {
+        normalize_link(extract_plain_text(row["properties"].get("Link", {})))
+        for row in rows
+    }
 
-# Überschreiben der Originaldatei
-bereinigt.to_csv("scraped_events_formatted.csv", index=False, encoding="utf-8")
-print(f"✅ {len(duplikate)} Duplikate entfernt. Neue scraped_events_formatted.csv gespeichert mit {len(bereinigt)} Zeilen.")
+def filter_new_events(events):
+    """Gibt nur die Events zurück, deren Link noch nicht in Notion steht (ohne Zwischendateien)."""
+    existing = existing_links()
+    new_events = []
+    for event in events:
+        link = normalize_link(event["Link"])
+        if link not in existing:
+            existing.add(link)
+            new_events.append(event)
+    print(f"✅ {len(events) - len(new_events)} Duplikate entfernt. {len(new_events)} neue Events für Notion.")
+    return new_events
+
+def remove_known_events(events_path=EVENTS_PATH):
+    """Entfernt alle Events aus der Parquet-Datei, deren Link schon in Notion steht."""
+    events = filter_new_events(Artifacts.read_events(events_path))
+    Artifacts.write_events(events, events_path)
+    return events
 
 # === FUNKTION: ISO-Datum mit oder ohne Enddatum parsen
 def parse_date_range_iso(value):
@@ -117,7 +126,7 @@ def parse_date_range_iso(value):
 
 # === FUNKTION: Bereits vorhandene Events aus Notion abrufen
 def get_existing_events():
-    url = f"https://api.notion.com/v1/databases/{DATABASE_ID}/query"
+    url = f"{NOTION_API_URL}/databases/{DATABASE_ID}/query"
     payload = {}
     existing_events = []
     has_more = True
@@ -126,7 +135,8 @@ def get_existing_events():
     while has_more:
         if next_cursor:
             payload = {"start_cursor": next_cursor}
-        response = requests.post(url, headers=headers, json=payload)
+        with Tracing.span("notion_query"):
+            response = requests.post(url, headers=headers, json=payload)
         if response.status_code != 200:
             print("❌ Fehler beim Abrufen der bestehenden Events:", response.status_code, response.text)
             return existing_events
@@ -169,12 +179,13 @@ def create_page(row):
     payload = {"parent": {"database_id": DATABASE_ID}, "properties": properties}
 
     try:
-        resp = requests.post(
-            "https://api.notion.com/v1/pages",
-            headers=headers,
-            json=payload,
-            timeout=15          # Netzwerk-Timeout
-        )
+        with Tracing.span("notion_create", site=str(row["Organisation"]), event=str(row["Titel"])):
+            resp = requests.post(
+                f"{NOTION_API_URL}/pages",
+                headers=headers,
+                json=payload,
+                timeout=15          # Netzwerk-Timeout
+            )
         if resp.status_code != 200:
             # Fehler protokollieren, aber Programm weiterführen
             FAILED_EVENTS.append({
@@ -200,12 +211,19 @@ def create_page(row):
 def import_csv_to_notion(csv_path):
     df = pd.read_csv(csv_path)
     df.columns = [c.strip() for c in df.columns]
+    upload_events(df.to_dict(orient="records"))
 
-    for _, row in df.iterrows():
-        create_page(row)
+# === FUNKTION: Events (Liste von Dicts) in Notion importieren
+def upload_events(events):
+    for event in events:
+        create_page(event)
         time.sleep(0.3)          # API-Rate-Limit
 
     # Nach der Schleife evtl. Fehlversuche sichern
+    save_failed_events()
+
+def save_failed_events():
+    """Speichert fehlgeschlagene Uploads in notion_failed_events.csv."""
     if FAILED_EVENTS:
         pd.DataFrame(FAILED_EVENTS).to_csv(
             "notion_failed_events.csv", index=False, encoding="utf-8"
@@ -214,18 +232,23 @@ def import_csv_to_notion(csv_path):
     else:
         print("🎉 Alle Events erfolgreich übertragen")
 
+# === FUNKTION: Zwischendateien löschen
+def delete_files(files_to_delete=(Artifacts.SCRAPED_PATH, EVENTS_PATH)):
+    for file in files_to_delete:
+        try:
+            os.remove(file)
+            print(f"🗑️ Datei gelöscht: {file}")
+        except FileNotFoundError:
+            print(f"⚠️ Datei nicht gefunden: {file}")
+        except Exception as e:
+            print(f"❌ Fehler beim Löschen von {file}: {e}")
+
 # === START
 if __name__ == "__main__":
-    import_csv_to_notion(CSV_PATH)
+    sys.stdout.reconfigure(encoding='utf-8')
+    upload_events(remove_known_events(EVENTS_PATH))
+    # Eigener Trace für den Einzellauf (Tracing.py)
+    Tracing.export_script("NotionAPI")
 
-# Optional: Dateien löschen
-files_to_delete = ["scraped_events_formatted.csv", "notion_export.csv", "scraped_events_formatted.xlsx"]
-
-for file in files_to_delete:
-    try:
-        os.remove(file)
-        print(f"🗑️ Datei gelöscht: {file}")
-    except FileNotFoundError:
-        print(f"⚠️ Datei nicht gefunden: {file}")
-    except Exception as e:
-        print(f"❌ Fehler beim Löschen von {file}: {e}")
\ No newline at end of file
+    # Optional: Dateien löschen
+    delete_files()
\ No newline at end of file
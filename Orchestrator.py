@@ -0,0 +1,181 @@
+# Führt die scrape()-Funktionen der Websites parallel in eigenen Worker-Prozessen aus.
+# Jeder Worker startet sein eigenes Chrome, die Laufzeit entspricht damit etwa der langsamsten Website.
+# run_all() gibt alle Events auf einmal zurück, stream_all() reicht sie einzeln weiter, sobald ein
+# Worker sie gefunden hat (für die Streaming-Pipeline in Pipeline.py).
+import importlib
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from SeenStore import seen_store
+import Snapshots
+import Tracing
+
+# Anzahl paralleler Worker-Prozesse (1 = alles nacheinander im Hauptprozess)
+SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "4"))
+
+
+def run_site(name, module_path):
+    """Importiert ein Website-Modul im Worker-Prozess und ruft dessen scrape() auf."""
+    start = time.time()
+    with Tracing.span("site", site=name):
+        try:
+            module = importlib.import_module(module_path)
+            events = list(module.scrape())
+        except Exception as e:
+            # Eine fehlerhafte Website soll nicht den ganzen Lauf abbrechen
+            print(f"❌ Fehler beim Scrapen von {name}: {e}")
+            events = []
+    if Snapshots.REPLAYING:
+        for event in events:
+            event["Link"] = Snapshots.restore(event.get("Link"))
+    try:
+        # Neu geladene Events merken, damit sie beim nächsten Lauf nicht erneut geladen werden
+        seen_store.remember(events)
+    except Exception as e:
+        print(f"⚠️ Bekannte Links für {name} konnten nicht gespeichert werden: {e}")
+    return events, time.time() - start, collect_stats()
+
+
+def collect_stats():
+    """
+    Laufzeit-Statistiken dieses Prozesses seit dem letzten Aufruf:
+    Chrome-Starts/-Wiederverwendungen des DriverPools, Wartezeiten der WaitEngine und die Tracing-Spans.
+    Module, die nicht importiert wurden, liefern leere Werte.
+    """
+    stats = {"driver": {"launches": 0, "reuses": 0, "sessions": []}, "waits": {}, "spans": Tracing.drain()}
+    pool_module = sys.modules.get("DriverPool")
+    if pool_module is not None:
+        stats["driver"] = pool_module.driver_pool.drain_stats()
+    wait_module = sys.modules.get("WaitEngine")
+    if wait_module is not None:
+        stats["waits"] = wait_module.drain_stats()
+    return stats
+
+
+def run_all(sites, workers=SCRAPER_WORKERS):
+    """
+    Scraped alle Websites parallel und gibt die Events als eine Liste zurück.
+    sites ist eine Liste von (Name, Modulpfad), z. B. ("TUM", "Websites.TUM").
+    Die Events werden in der Reihenfolge von sites zusammengeführt, egal welcher Worker zuerst fertig ist.
+    """
+    start = time.time()
+    if Snapshots.REPLAYING:
+        # Vor dem Start der Worker, damit sie die Ports der Server erben
+        Snapshots.start_replay_servers()
+
+    if workers <= 1:
+        results = [run_site(name, module_path) for name, module_path in sites]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sites))) as executor:
+            futures = [executor.submit(run_site, name, module_path) for name, module_path in sites]
+            results = [future.result() for future in futures]
+
+    all_events = []
+    sessions = {}
+    for (name, _), (events, duration, stats) in zip(sites, results):
+        report_site(name, len(events), duration, stats, sessions)
+        all_events.extend(events)
+
+    report_sessions(sessions, start, workers)
+    return all_events
+
+
+def report_site(name, count, duration, stats, sessions):
+    """Gibt die Statistik einer Website aus und merkt sich ihre Chrome-Sessions für report_sessions()."""
+    driver = stats["driver"]
+    print(f"⏱️ {name}: {count} Events in {duration:.1f}s "
+          f"(Chrome: {driver['launches']} gestartet, {driver['reuses']} wiederverwendet)")
+    for site, waits in stats["waits"].items():
+        print(f"   Wartezeiten {site}: {waits['waits']}x gewartet, {waits['timeouts']} Timeouts, "
+              f"Ø {waits['mean_s']:.2f}s, max {waits['max_s']:.2f}s, gesamt {waits['total_s']:.1f}s")
+    Tracing.extend(stats["spans"])
+    for session in driver["sessions"]:
+        sessions[session["session"]] = session
+
+
+def report_sessions(sessions, start, workers):
+    print(f"⏱️ Alle Websites gescraped in {time.time() - start:.1f}s mit {workers} Worker(n)")
+    for session in sessions.values():
+        print(f"   Chrome-Session {session['session']}: {session['borrows']}x ausgeliehen "
+              f"({session['borrows'] - 1}x wiederverwendet), {session['page_loads']} Seitenaufrufe")
+
+
+def stream_site(name, module_path, event_queue):
+    """
+    Wie run_site(), legt aber jedes Event sofort in event_queue: ("event", Name, Event).
+    Zum Schluss folgt ("done", Name, (Anzahl, Dauer, Statistik)).
+    """
+    start = time.time()
+    count = 0
+    with Tracing.span("site", site=name):
+        try:
+            module = importlib.import_module(module_path)
+            for event in module.scrape():
+                if Snapshots.REPLAYING:
+                    event["Link"] = Snapshots.restore(event.get("Link"))
+                try:
+                    seen_store.remember([event])
+                except Exception as e:
+                    print(f"⚠️ Bekannter Link für {name} konnte nicht gespeichert werden: {e}")
+                event_queue.put(("event", name, event))
+                count += 1
+        except Exception as e:
+            # Eine fehlerhafte Website soll nicht den ganzen Lauf abbrechen
+            print(f"❌ Fehler beim Scrapen von {name}: {e}")
+    event_queue.put(("done", name, (count, time.time() - start, collect_stats())))
+
+
+def stream_sequential(sites, event_queue):
+    for name, module_path in sites:
+        stream_site(name, module_path, event_queue)
+
+
+def stream_all(sites, workers=SCRAPER_WORKERS):
+    """
+    Scraped alle Websites parallel und gibt jedes Event zurück, sobald es gefunden wurde (Generator).
+    Die Reihenfolge ergibt sich daraus, welcher Worker zuerst liefert.
+    """
+    start = time.time()
+    if Snapshots.REPLAYING:
+        Snapshots.start_replay_servers()
+
+    sessions = {}
+    remaining = len(sites)
+    if workers <= 1:
+        # Auch ohne Worker in einem eigenen Thread, damit der Verbraucher schon arbeiten kann
+        event_queue = queue.Queue()
+        producer = threading.Thread(target=stream_sequential, args=(sites, event_queue), daemon=True)
+        producer.start()
+        futures = []
+    else:
+        manager = multiprocessing.Manager()
+        event_queue = manager.Queue()
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(sites)))
+        futures = [executor.submit(stream_site, name, module_path, event_queue) for name, module_path in sites]
+
+    try:
+        while remaining:
+            try:
+                kind, name, payload = event_queue.get(timeout=1)
+            except queue.Empty:
+                # Ein abgestürzter Worker meldet sich nie mit "done"
+                if futures and all(future.done() for future in futures) and event_queue.empty():
+                    print(f"❌ {remaining} Website(s) ohne Abschlussmeldung beendet")
+                    break
+                continue
+            if kind == "event":
+                yield payload
+            else:
+                count, duration, stats = payload
+                report_site(name, count, duration, stats, sessions)
+                remaining -= 1
+    finally:
+        if futures:
+            executor.shutdown(wait=True, cancel_futures=True)
+            manager.shutdown()
+    report_sessions(sessions, start, workers)
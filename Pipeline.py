@@ -0,0 +1,83 @@
+# Streaming-Pipeline: Scrapen -> Datum formatieren -> Duplikate entfernen -> Notion-Abgleich -> Upload.
+# Jedes Event läuft einzeln durch eine Kette von Generatoren, sobald ein Worker es gefunden hat.
+# Die ersten Events sind damit schon in Notion, während langsame Websites noch laufen, und es liegt
+# nie die ganze Eventliste im Speicher (nur die Schlüssel für den Duplikat-Abgleich).
+#
+#   python event-scraper.py --stream
+import time
+
+import Artifacts
+import Datumsformatierung
+import Dedup
+import NearDuplicates
+import NotionAPI
+import Orchestrator
+
+def dedup(events):
+    """Lässt jedes Event (gleicher Link, Titel und Starttag, siehe Dedup.py) nur einmal durch."""
+    yield from Dedup.DedupIndex().filter(events)
+
+
+def normalize_dates(events):
+    """Formatiert das Datum jedes Events wie Datumsformatierung.py."""
+    for event in events:
+        yield Datumsformatierung.process_event(event)
+
+
+def write_parquet(events, path):
+    """Schreibt die durchlaufenden Events blockweise in eine Parquet-Datei (Artifacts.py, für Logs/Nachvollziehbarkeit)."""
+    with Artifacts.ParquetStream(path) as stream:
+        for event in events:
+            stream.write(event)
+            yield event
+
+
+def not_in_notion(events):
+    """Lässt nur Events durch, deren Link noch nicht in Notion steht (Abgleich wie in NotionAPI.py)."""
+    existing = None
+    skipped = 0
+    for event in events:
+        if existing is None:
+            # Erst beim ersten Event abfragen, die Worker scrapen in der Zwischenzeit schon
+            existing = NotionAPI.existing_links()
+            print(f"✅ {len(existing)} Links bereits in Notion")
+        link = NotionAPI.normalize_link(event["Link"])
+        if link in existing:
+            skipped += 1
+            continue
+        existing.add(link)
+        yield event
+    print(f"✅ {skipped} Duplikate entfernt (bereits in Notion).")
+
+
+def upload(events, start):
+    """Legt jedes Event als Page in Notion an (mit Pause für das API-Rate-Limit)."""
+    for index, event in enumerate(events):
+        NotionAPI.create_page(event)
+        if index == 0:
+            print(f"⏱️ Erstes Event nach {time.time() - start:.1f}s in Notion")
+        time.sleep(0.3)          # API-Rate-Limit
+        yield event
+
+
+def run(sites, workers=Orchestrator.SCRAPER_WORKERS, artifact_path=Artifacts.FORMATTED_PATH, upload_to_notion=True):
+    """Führt die ganze Pipeline für die gewählten Websites aus und gibt die Anzahl der durchgelaufenen Events zurück."""
+    start = time.time()
+    events = Orchestrator.stream_all(sites, workers)
+    # Erst das Datum formatieren, der Duplikat-Abgleich nutzt das Startdatum
+    events = normalize_dates(events)
+    events = dedup(events)
+    events = NearDuplicates.drop(events)
+    events = write_parquet(events, artifact_path)
+    if upload_to_notion:
+        events = not_in_notion(events)
+        events = upload(events, start)
+
+    count = 0
+    for _ in events:
+        count += 1
+
+    if upload_to_notion:
+        NotionAPI.save_failed_events()
+    print(f"✅ Pipeline fertig: {count} Events in {time.time() - start:.1f}s")
+    return count
@@ -0,0 +1,157 @@
+# Lokaler Speicher (SQLite) aller bereits gescrapten Detailseiten.
+# Vor dem Laden einer Detailseite wird geprüft, ob der Link schon bekannt ist. Bekannte Events werden
+# nicht erneut geladen, sondern aus dem Speicher übernommen – die Arbeit wächst so mit den neuen
+# Events statt mit allen gelisteten. Nach SEEN_REFRESH_DAYS wird eine Seite trotzdem neu geladen,
+# damit geänderte Events (erkennbar am Fingerprint) nachgezogen werden.
+# Die Datei wird vom Workflow zusammen mit den anderen Ergebnissen ins Repo committed.
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Abschalten mit SEEN_STORE=0 (dann wird jede Detailseite geladen); bei Aufnahme/Wiedergabe (Snapshots.py) immer aus
+ENABLED = os.getenv("SEEN_STORE", "1") != "0" and not os.getenv("SNAPSHOT_MODE")
+DB_PATH = os.getenv("SEEN_DB", "seen_links.sqlite")
+# Bekannte Seiten nach so vielen Tagen erneut laden
+REFRESH_DAYS = float(os.getenv("SEEN_REFRESH_DAYS", "28"))
+
+# Query-Parameter, die nur der Nachverfolgung dienen und denselben Link unterschiedlich aussehen lassen
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "aff", "ref", "_gl"}
+
+FINGERPRINT_FIELDS = ["Titel", "Datum", "Location", "Description"]
+
+# Ersatzwerte der Scraper für nicht gefundene Felder, z. B. "Kein Titel gefunden" (SiteEngine.DEFAULTS)
+PLACEHOLDER = re.compile(r"^Keine? \w+ gefunden$")
+
+
+def canonical_link(link):
+    """Einheitliche Form eines Links: Host klein, ohne Fragment, Tracking-Parameter und Schrägstrich am Ende."""
+    parts = urlsplit(link.strip())
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def is_complete(event):
+    """True, wenn Titel, Datum und Link echte Werte sind (keine leeren Felder oder Ersatzwerte)."""
+    for field in ("Titel", "Datum", "Link"):
+        value = event.get(field)
+        if value is None or value != value:    # None oder NaN
+            return False
+        value = str(value).strip()
+        if not value or PLACEHOLDER.match(value):
+            return False
+    return str(event["Link"]).startswith("http")
+
+
+def fingerprint(event):
+    """Hash über den Inhalt eines Events (ohne Link und Organisation)."""
+    content = "\x1f".join(" ".join(str(event.get(field) or "").split()) for field in FINGERPRINT_FIELDS)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class SeenStore:
+    def __init__(self, path=DB_PATH, refresh_days=REFRESH_DAYS):
+        self.path = path
+        self.refresh_seconds = refresh_days * 86400
+        self.lock = threading.Lock()
+        self.connection = None
+        self.served = set()     # In diesem Prozess aus dem Speicher übernommene Links
+
+    def _connect(self):
+        if self.connection is None:
+            # Mehrere Worker-Prozesse schreiben in dieselbe Datei, daher mit Wartezeit auf Sperren
+            self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS seen (
+                    link TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    event TEXT NOT NULL,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL,
+                    last_fetched REAL NOT NULL
+                )
+            """)
+            self.connection.commit()
+        return self.connection
+
+    def split(self, links):
+        """
+        Teilt Links in bereits bekannte und zu ladende auf.
+        Rückgabe: (events, links) – events sind die gespeicherten Events der bekannten Links,
+        links die Links, deren Detailseite geladen werden muss (in der ursprünglichen Reihenfolge).
+        """
+        if not ENABLED or not links:
+            return [], list(links)
+        now = time.time()
+        events = []
+        to_fetch = []
+        with self.lock:
+            connection = self._connect()
+            for link in links:
+                key = canonical_link(link)
+                row = connection.execute("SELECT event, last_fetched FROM seen WHERE link = ?", (key,)).fetchone()
+                if row is None or now - row[1] >= self.refresh_seconds:
+                    to_fetch.append(link)
+                    continue
+                event = json.loads(row[0])
+                event["Link"] = link
+                if not is_complete(event):
+                    # Unvollständig aus einem früheren Lauf gespeichert: Seite neu laden
+                    to_fetch.append(link)
+                    continue
+                events.append(event)
+                self.served.add(key)
+                connection.execute("UPDATE seen SET last_seen = ? WHERE link = ?", (now, key))
+            connection.commit()
+        if events:
+            print(f"🗃️ {len(events)} bekannte Events aus {self.path} übernommen, {len(to_fetch)} Detailseiten werden geladen")
+        return events, to_fetch
+
+    def remember(self, events):
+        """Speichert frisch gescrapte Events (Link, Fingerprint, Zeitstempel). Gibt die Anzahl geänderter Events zurück."""
+        if not ENABLED:
+            return 0
+        now = time.time()
+        changed = 0
+        skipped = 0
+        with self.lock:
+            connection = self._connect()
+            for event in events:
+                # Fehlgeschlagene Auslesungen nicht speichern, sonst würden sie REFRESH_DAYS lang ausgeliefert
+                if not is_complete(event):
+                    skipped += 1
+                    continue
+                key = canonical_link(event["Link"])
+                if key in self.served:
+                    # Kam aus dem Speicher, wurde also nicht neu geladen
+                    continue
+                new_fingerprint = fingerprint(event)
+                row = connection.execute("SELECT fingerprint FROM seen WHERE link = ?", (key,)).fetchone()
+                if row is None:
+                    connection.execute(
+                        "INSERT INTO seen (link, fingerprint, event, first_seen, last_seen, last_fetched) VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, new_fingerprint, json.dumps(event, ensure_ascii=False), now, now, now),
+                    )
+                    continue
+                if row[0] != new_fingerprint:
+                    changed += 1
+                connection.execute(
+                    "UPDATE seen SET fingerprint = ?, event = ?, last_seen = ?, last_fetched = ? WHERE link = ?",
+                    (new_fingerprint, json.dumps(event, ensure_ascii=False), now, now, key),
+                )
+            connection.commit()
+        if changed:
+            print(f"🗃️ {changed} bekannte Events haben sich geändert")
+        if skipped:
+            print(f"🗃️ {skipped} unvollständige Events nicht gespeichert, ihre Seiten werden beim nächsten Lauf neu geladen")
+        return changed
+
+
+# Ein Speicher pro Prozess; die Datei wird erst beim ersten Zugriff geöffnet
+seen_store = SeenStore()
@@ -0,0 +1,331 @@
+# Gemeinsame Scraping-Laufzeit für Websites, die über eine Spezifikation (SPEC) beschrieben werden.
+# Statt jede Website als Kopie von Vorlage_LuMa.py / Vorlage_Eventbride.py zu schreiben, beschreibt ein
+# Website-Modul nur noch URLs und Selektoren. Alle Optimierungen (HTTP-Schnellpfad, eingebettete
+# JSON-Daten, parallele Detailseiten, Batch-Extraktion, bedingtes Warten, Driver-Pool) stecken hier.
+#
+# Aufbau einer SPEC (alle Selektoren sind XPaths):
+#   site            Name für Logs und Wartezeit-Statistik (WaitEngine.SITE_TIMEOUTS)
+#   organisation    Wert der Spalte "Organisation"
+#   listing_url     Übersichtsseite; mit "{page}" und pages=N werden mehrere Seiten geladen
+#   pages           Höchstzahl Seiten (optional, Abbruch bei der ersten leeren oder wiederholten Seite)
+#   cookie_button   Button, der auf der ersten Seite geklickt wird (optional)
+#   card_xpath      Ein Treffer pro Event auf der Übersichtsseite
+#   card_fields     {Spalte: (XPath relativ zur Karte, Attribut oder None[, Trennzeichen])}
+#   link_prefix     Nur Links mit diesem Anfang übernehmen (optional)
+#   http            True, wenn die Übersichtsseite serverseitig gerendert wird (lxml statt Chrome)
+#   structured      True, wenn die Seiten Events als JSON-LD/__NEXT_DATA__ einbetten
+#   api             Funktion ohne Argumente, die alle Events über eine Plattform-API liefert (optional,
+#                   z. B. LumaCalendar.scrape); gibt sie nichts zurück, wird wie gewohnt gescrapt
+#   detail          Detailseiten-Regeln (optional, sonst kommen alle Felder aus den Karten):
+#                     wait      Element, auf das nach dem Laden gewartet wird
+#                     fields    {Spalte: (absoluter XPath, Attribut oder None[, Trennzeichen])}
+#                     required  Spalten, ohne die eine per HTTP geladene Seite als unbrauchbar gilt
+#                     click     Button, der vor dem Auslesen geklickt wird (optional)
+#   defaults        Ersatzwerte für fehlende Felder (optional)
+#   description_cut Kürzen langer Beschreibungen auf diese Länge (Standard 1997)
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+from DriverPool import driver_pool
+from HttpCache import http_cache
+import BatchExtraction
+import HttpFetcher
+import LumaCalendar
+import StructuredData
+import Tracing
+import WaitEngine
+
+DEFAULTS = {
+    "Titel": "Kein Titel gefunden",
+    "Datum": "Kein Datum gefunden",
+    "Location": "Kein Location gefunden",
+    "Description": "Keine Description gefunden",
+    "Link": "Kein Link gefunden",
+}
+
+
+def scrape(spec):
+    """
+    Scraped eine Website anhand ihrer SPEC und gibt die Events einzeln zurück (Generator),
+    sodass die Pipeline sie schon weiterverarbeiten kann, während die restlichen Seiten noch laden.
+    """
+    if spec.get("api"):
+        events = spec["api"]()
+        if events:
+            yield from events
+            return
+        print(f"⚠️ {spec['site']}: Keine Events über die API, Fallback auf die Website")
+    if spec.get("detail"):
+        event_links = collect_links(spec)
+        print(f"Gefundene Events: {len(event_links)}")
+        yield from scrape_details(spec, event_links)
+        return
+    for card in listing_cards(spec):
+        yield make_event(spec, card)
+
+
+def listing_urls(spec):
+    if spec.get("pages"):
+        return [spec["listing_url"].format(page=page) for page in range(1, spec["pages"] + 1)]
+    return [spec["listing_url"]]
+
+
+def make_event(spec, values, link=None):
+    """Baut aus den ausgelesenen Feldern ein Event-Dict mit Ersatzwerten und gekürzter Beschreibung."""
+    defaults = dict(DEFAULTS, **spec.get("defaults", {}))
+    event = {"Organisation": spec["organisation"]}
+    for name in ["Titel", "Datum", "Location", "Description", "Link"]:
+        value = values.get(name)
+        if name == "Link" and link:
+            value = link
+        event[name] = value.strip() if value and value.strip() else defaults[name]
+
+    event["Description"] = StructuredData.truncate(event["Description"], spec.get("description_cut", 1997))
+    return event
+
+
+def extract_http(element, fields):
+    """Wie BatchExtraction.extract_cards(), aber auf einem lxml-Element."""
+    values = {}
+    for name, field in fields.items():
+        xpath, attribute, separator = (list(field) + [None, None])[:3]
+        if attribute:
+            values[name] = HttpFetcher.attr(element, xpath, attribute)
+        elif separator is not None:
+            values[name] = separator.join(HttpFetcher.texts(element, xpath)) or None
+        else:
+            values[name] = HttpFetcher.text(element, xpath)
+    return values
+
+
+def listing_cards(spec):
+    """Karten der Übersichtsseite(n): zuerst per HTTP (falls möglich), sonst mit Chrome."""
+    if spec.get("http") and HttpFetcher.FAST_PATH:
+        cards = listing_cards_http(spec)
+        if any(card.get("Titel") or card.get("Link") for card in cards):
+            return cards
+        print(f"⚠️ {spec['site']}: Kein verwertbarer Inhalt per HTTP, Fallback auf Selenium")
+    return listing_cards_selenium(spec)
+
+
+def listing_cards_http(spec):
+    cards = []
+    for url in listing_urls(spec):
+        tree = HttpFetcher.fetch_tree(url)
+        if tree is None:
+            break
+        elements = tree.xpath(spec["card_xpath"])
+        if not elements:
+            break
+        page_cards = [extract_http(element, spec["card_fields"]) for element in elements]
+        # Manche Seiten liefern hinter der letzten Seite wieder die letzte aus, dann aufhören
+        if all(card in cards for card in page_cards):
+            break
+        cards.extend(page_cards)
+    return cards
+
+
+def listing_cards_selenium(spec):
+    driver = None
+    cards = []
+    try:
+        for index, url in enumerate(listing_urls(spec)):
+            # Bereits gerenderte Seite aus dem Cache: ohne Chrome mit lxml auswerten
+            tree = rendered_tree(url)
+            if tree is not None:
+                page_cards = [extract_http(element, spec["card_fields"]) for element in tree.xpath(spec["card_xpath"])]
+            else:
+                if driver is None:
+                    driver = driver_pool.acquire()
+                WaitEngine.load(driver, url, By.XPATH, spec["card_xpath"], spec["site"], label="Eventliste")
+                if index == 0 and spec.get("cookie_button"):
+                    click(driver, spec, spec["cookie_button"], "Cookie-Banner")
+
+                # Alle Karten mit allen Feldern in einem einzigen Roundtrip auslesen
+                page_cards = BatchExtraction.extract_cards(driver, spec["card_xpath"], spec["card_fields"])
+                if page_cards:
+                    store_rendered(driver, url)
+            if not page_cards or all(card in cards for card in page_cards):
+                break
+            cards.extend(page_cards)
+    finally:
+        if driver is not None:
+            driver_pool.release(driver)
+    return cards
+
+
+def rendered_tree(url):
+    """Von Chrome gerendertes DOM einer Seite aus dem HttpCache (None, wenn nicht vorhanden oder abgelaufen)."""
+    content = http_cache.get(url, kind="rendered")
+    if not content:
+        return None
+    return HttpFetcher.parse(content, url)
+
+
+def store_rendered(driver, url):
+    """Legt das von Chrome gerenderte DOM der aktuellen Seite für rendered_tree() im HttpCache ab."""
+    http_cache.store(url, driver.page_source, kind="rendered")
+
+
+def cached_detail(link, extract):
+    """
+    Für handgeschriebene Scraper: extract(tree, link) auf dem gerenderten DOM eines früheren Laufs.
+    None, wenn die Seite nicht im Cache ist oder extract nichts Verwertbares findet.
+    """
+    tree = rendered_tree(link)
+    return extract(tree, link) if tree is not None else None
+
+
+def click(driver, spec, xpath, label):
+    """Klickt einen Button (falls vorhanden) und wartet, bis er verschwunden ist."""
+    try:
+        button = driver.find_element(By.XPATH, xpath)
+        button.click()
+        WaitEngine.wait_gone(driver, button, spec["site"], label=label)
+    except NoSuchElementException:
+        pass
+
+
+def collect_links(spec):
+    """Links aller Detailseiten: aus eingebetteten Daten, per HTTP oder mit Chrome."""
+    event_links = []
+    if spec.get("structured") and HttpFetcher.FAST_PATH:
+        for url in listing_urls(spec):
+            tree = HttpFetcher.fetch_tree(url)
+            if tree is not None:
+                event_links.extend(StructuredData.event_links(tree, url, prefix=spec.get("link_prefix")))
+
+    if not event_links:
+        event_links = [card.get("Link") for card in listing_cards(spec)]
+
+    # Leere, fremde und doppelte Links entfernen
+    unique_links = []
+    for link in event_links:
+        if not link or (spec.get("link_prefix") and not link.startswith(spec["link_prefix"])):
+            print(f"Link wird übersprungen: {link}")
+            continue
+        if link not in unique_links:
+            unique_links.append(link)
+    return unique_links
+
+
+def scrape_details(spec, event_links):
+    """Detailseiten gleichzeitig per HTTP laden, nur Seiten ohne verwertbaren Inhalt mit Chrome (Generator)."""
+    fallback_links = yield from HttpFetcher.iter_details(event_links, lambda tree, link: extract_detail_http(spec, tree, link))
+    driver = None
+    try:
+        for link in fallback_links:
+            event = extract_detail_rendered(spec, link)
+            if event is None:
+                if driver is None:
+                    driver = driver_pool.acquire()
+                event = extract_detail_selenium(spec, driver, link)
+            yield event
+    finally:
+        if driver is not None:
+            driver_pool.release(driver)
+
+
+def extract_detail_http(spec, tree, link):
+    if spec.get("structured"):
+        event = StructuredData.to_event(tree, link, spec["organisation"], cut_at=spec.get("description_cut", 1997))
+        if event:
+            return event
+
+    detail = spec["detail"]
+    values = extract_http(tree, detail["fields"])
+    if any(not values.get(name) for name in detail.get("required", ["Titel"])):
+        return None
+    return make_event(spec, values, link)
+
+
+def extract_detail_rendered(spec, link):
+    """Detailseite aus dem gerenderten DOM eines früheren Laufs (None, wenn nicht im Cache)."""
+    tree = rendered_tree(link)
+    if tree is None:
+        return None
+    event = make_event(spec, extract_http(tree, spec["detail"]["fields"]), link)
+    print(f"{spec['site']} - Titel (Cache): {event['Titel']}")
+    return event
+
+
+def extract_detail_selenium(spec, driver, link):
+    with Tracing.span("detail", site=spec["site"], event=link):
+        return _extract_detail_selenium(spec, driver, link)
+
+
+def _extract_detail_selenium(spec, driver, link):
+    detail = spec["detail"]
+    WaitEngine.load(driver, link, By.XPATH, detail["wait"], spec["site"], label="Detailseite")
+    if detail.get("click"):
+        try:
+            driver.find_element(By.XPATH, detail["click"]).click()
+            WaitEngine.wait_for(driver, By.XPATH, detail["wait"], spec["site"], label="Eventdetails")
+        except NoSuchElementException:
+            pass
+
+    # Alle Felder der Detailseite in einem Roundtrip
+    values = BatchExtraction.extract_cards(driver, "/html", detail["fields"])
+    event = make_event(spec, values[0] if values else {}, driver.current_url)
+    if values:
+        store_rendered(driver, link)
+    print(f"{spec['site']} - Titel: {event['Titel']}")
+    return event
+
+
+# --- Plattform-Vorlagen ---
+
+def luma_spec(calendar_url, organisation, site="LuMa", handle=None):
+    """
+    SPEC für einen lu.ma-Kalender (z. B. "https://lu.ma/vlsa?compact=true").
+    Die Events kommen zuerst über die lu.ma-API (LumaCalendar.py, Handle aus der URL), die Selektoren
+    sind der Fallback, falls die API nicht antwortet.
+    """
+    handle = handle or LumaCalendar.handle_from_url(calendar_url)
+    return {
+        "site": site,
+        "organisation": organisation,
+        "listing_url": calendar_url,
+        "api": lambda: LumaCalendar.scrape(handle, organisation),
+        "structured": True,
+        "card_xpath": "//*[@id='__next']/div/div/div[2]/div/div/div[2]/div/div[2]/div[last()]/div[1]/div",
+        "card_fields": {"Link": ("./div[2]/a", "href")},
+        "link_prefix": "https://lu.ma/",
+        "detail": {
+            "wait": "//*[@id='__next']/div/div[2]/div/div/div[7]/div/div[2]/div[1]/div/div[1]/div/h1",
+            "fields": {
+                "Titel": ("//*[@id='__next']/div/div[2]/div/div/div[7]/div/div[2]/div[1]/div/div[1]/div/h1", None),
+                "Datum": ("//*[@id='__next']/div/div[2]/div/div/div[7]/div/div[2]/div[1]/div/div[3]/div/div[1]/div[2]/div", None, " "),
+                "Location": ("//*[@id='__next']/div/div[2]/div/div/div[7]/div/div[2]/div[1]/div/div[3]/a/div/div[2]/div/div/div[1]", None),
+                "Description": ("//*[@id='__next']/div/div[2]/div/div/div[7]/div/div[2]/div[3]/div[2]/div", None),
+            },
+            "required": ["Titel", "Datum"],
+        },
+        "defaults": {"Location": ""},
+        "description_cut": 1800,
+    }
+
+
+def eventbrite_spec(organizer_url, organisation, site="Eventbrite"):
+    """SPEC für eine Eventbrite-Veranstalterseite (z. B. "https://www.eventbrite.de/o/...")."""
+    return {
+        "site": site,
+        "organisation": organisation,
+        "listing_url": organizer_url,
+        "structured": True,
+        "card_xpath": "//*[@id='events']/section/div/div[1]/div/div[1]/div",
+        "card_fields": {"Link": ("./a", "href")},
+        "detail": {
+            "wait": f"//*[{HttpFetcher.has_class('date-info__full-datetime')}]",
+            "click": "//*[@id='root']/div/div/div[2]/div/div/div/div[1]/div/main/div[1]/div[1]/div[2]/div[2]/div[1]/div[11]/div[1]/div/button",
+            "fields": {
+                "Titel": ("//*[@id='root']/div/div/div[2]/div/div/div/div[1]/div/main/div[1]/div[1]/div[2]/div[2]/div[1]/div[5]/div/h1", None),
+                "Datum": (f"//*[{HttpFetcher.has_class('date-info__full-datetime')}]", None),
+                "Location": ("//*[@id='root']/div/div/div[2]/div/div/div/div[1]/div/main/div[1]/div[1]/div[2]/div[2]/div[1]/div[11]/section/div/div/div/div[2]/div/p", None),
+                "Description": (f"//*[{HttpFetcher.has_class('eds-text--left')}]", None),
+            },
+            "required": ["Titel", "Datum"],
+        },
+        "defaults": {"Location": ""},
+        "description_cut": 1800,
+    }
@@ -0,0 +1,96 @@
+# Verzeichnis aller Websites, die gescraped werden können.
+# Jedes Modul unter Websites/ wird automatisch registriert, unter seinem Dateinamen. Weitere Angaben
+# stehen als Konstanten im Modul und werden nur aus dem Quelltext gelesen – importiert wird das Modul
+# erst, wenn die Website im Lauf ausgewählt ist (im Worker-Prozess, siehe Orchestrator.run_site()):
+#   ORDER    Position in der finalen Excel (optional, Module ohne ORDER kommen danach)
+#   ALIASES  Kurznamen für --sites (optional)
+# Jede Website und jeder Kurzname darf nur einmal vorkommen – so kann kein Modul
+# unter mehreren Namen mehrfach gescraped werden.
+import ast
+import os
+import pkgutil
+
+SITES_PACKAGE = "Websites"
+SITES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), SITES_PACKAGE)
+
+# Vorlagen und Hilfsmodule, die selbst keine Website sind
+SKIP_PREFIXES = ("Vorlage_", "_")
+# Modul-Konstanten, die SiteRegistry.register_discovered() auswertet
+SITE_CONSTANTS = ("ALIASES", "ORDER")
+
+
+def site_constants(module_path):
+    """ALIASES und ORDER eines Website-Moduls aus dem Quelltext (nur Literale)."""
+    path = os.path.join(SITES_DIR, module_path.split(".")[-1] + ".py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name in SITE_CONSTANTS:
+                try:
+                    constants[name] = ast.literal_eval(node.value)
+                except ValueError:
+                    raise ValueError(f"{module_path}: {name} muss ein Literal sein")
+    return constants
+
+
+class SiteRegistry:
+    def __init__(self):
+        self.sites = {}      # Name -> Modulpfad (Reihenfolge = Reihenfolge in der finalen Excel)
+        self.aliases = {}    # Kurzname (klein geschrieben) -> Name
+
+    def register(self, name, module_path, aliases=()):
+        """Registriert eine Website; doppelte Namen, Kurznamen oder Module sind ein Fehler."""
+        if name in self.sites:
+            raise ValueError(f"Website '{name}' ist bereits registriert")
+        for other, other_path in self.sites.items():
+            if other_path == module_path:
+                raise ValueError(f"Modul '{module_path}' ist bereits als '{other}' registriert")
+        keys = [name.lower()] + [alias.lower() for alias in aliases]
+        for key in keys:
+            if key in self.aliases:
+                raise ValueError(f"Kurzname '{key}' ist bereits für '{self.aliases[key]}' vergeben")
+        self.sites[name] = module_path
+        for key in keys:
+            self.aliases[key] = name
+
+    def discover(self):
+        """Alle Website-Module unter Websites/ (ohne sie zu importieren)."""
+        return sorted(
+            f"{SITES_PACKAGE}.{module.name}"
+            for module in pkgutil.iter_modules([SITES_DIR])
+            if not module.name.startswith(SKIP_PREFIXES)
+        )
+
+    def register_discovered(self):
+        """Registriert alle Module unter Websites/ mit den Angaben aus ALIASES und ORDER."""
+        found = []
+        for module_path in self.discover():
+            constants = site_constants(module_path)
+            order = constants.get("ORDER", float("inf"))
+            found.append((order, module_path, constants))
+        for _, module_path, constants in sorted(found, key=lambda item: (item[0], item[1])):
+            self.register(module_path.split(".")[-1], module_path, aliases=constants.get("ALIASES", ()))
+
+    def select(self, names=None):
+        """
+        Gibt [(Name, Modulpfad), ...] für die gewählten Websites zurück.
+        names: Liste von Namen oder Kurznamen (Groß-/Kleinschreibung egal), None = alle.
+        """
+        if not names:
+            return list(self.sites.items())
+        selected = []
+        for key in names:
+            name = self.aliases.get(key.strip().lower())
+            if name is None:
+                raise ValueError(f"Unbekannte Website '{key}' (verfügbar: {', '.join(sorted(self.aliases))})")
+            if name not in selected:
+                selected.append(name)
+        # Reihenfolge der Registrierung beibehalten
+        return [(name, module_path) for name, module_path in self.sites.items() if name in selected]
+
+
+registry = SiteRegistry()
+registry.register_discovered()
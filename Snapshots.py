@@ -0,0 +1,226 @@
+# Aufnahme und Wiedergabe von Website-Snapshots, damit die Scraper offline und reproduzierbar laufen.
+#
+#   SNAPSHOT_MODE=record  Jede geladene Seite wird unter SNAPSHOT_DIR gespeichert: per HTTP geladene
+#                         Seiten direkt, in Chrome geladene Seiten samt Skripten, Stylesheets und
+#                         XHR/Fetch-Antworten (über das Performance-Log von Chrome).
+#   SNAPSHOT_MODE=replay  Pro aufgenommenem Host startet ein lokaler HTTP-Server auf 127.0.0.1.
+#                         HttpFetcher und Chrome werden auf diese Server umgeleitet, Chrome erreicht
+#                         keine anderen Hosts. Links in den Ergebnissen zeigen wieder auf die Original-URLs.
+#
+# In beiden Modi sind SeenStore und HttpCache aus, damit jeder Lauf dieselben Seiten lädt.
+# Aufbau von SNAPSHOT_DIR: <host>/<sha1 der URL ohne Fragment>.body (Inhalt) und .json (URL, Content-Type).
+import base64
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urldefrag, urlsplit, urlunsplit
+
+MODE = os.getenv("SNAPSHOT_MODE", "")
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "snapshots")
+RECORDING = MODE == "record"
+REPLAYING = MODE == "replay"
+
+# Ressourcentypen aus dem Chrome-Performance-Log, die für die Wiedergabe gebraucht werden
+RECORDED_TYPES = {"Document", "Script", "Stylesheet", "XHR", "Fetch"}
+
+# Umgebungsvariable, über die Worker-Prozesse die Ports der Wiedergabe-Server erben
+SERVERS_ENV = "SNAPSHOT_SERVERS"
+# Anfrage-Header für Snapshots ohne umgeschriebene Links
+RAW_HEADER = "X-Snapshot-Raw"
+
+_lock = threading.Lock()
+_servers = []
+_served = {"requests": 0, "pages": 0}   # Ausgelieferte Antworten / davon HTML-Seiten
+
+
+def _paths(url):
+    # Das Fragment (#...) geht nie an den Server, der Wiedergabe-Server sieht die URL also ohne
+    url = urldefrag(url)[0]
+    host = urlsplit(url).netloc.lower()
+    name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    directory = os.path.join(SNAPSHOT_DIR, host)
+    return directory, os.path.join(directory, f"{name}.body"), os.path.join(directory, f"{name}.json")
+
+
+def save(url, content, content_type="text/html; charset=utf-8"):
+    """Speichert eine geladene Seite (bytes oder str) als Snapshot."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    directory, body_path, meta_path = _paths(url)
+    os.makedirs(directory, exist_ok=True)
+    with open(body_path, "wb") as f:
+        f.write(content)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "content_type": content_type}, f)
+
+
+def load(url):
+    """Gibt (content, content_type) eines Snapshots zurück oder None."""
+    _, body_path, meta_path = _paths(url)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            return f.read(), meta["content_type"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def json_responses(host, directory=None):
+    """
+    Alle aufgenommenen JSON-Antworten eines Hosts als Liste von (URL, Daten), sortiert nach URL.
+    So lassen sich aufgenommene XHR/Fetch-Antworten offline auswerten (z. B. als Test-Fixture).
+    """
+    directory = os.path.join(directory or SNAPSHOT_DIR, host.lower())
+    responses = []
+    if not os.path.isdir(directory):
+        return responses
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                meta = json.load(f)
+            if "json" not in meta.get("content_type", ""):
+                continue
+            with open(os.path.join(directory, name[:-5] + ".body"), "rb") as f:
+                responses.append((meta["url"], json.loads(f.read())))
+        except (OSError, ValueError, KeyError):
+            continue
+    return sorted(responses, key=lambda response: response[0])
+
+
+def capture(driver, entries=None):
+    """
+    Speichert alle Antworten, die Chrome seit dem letzten Aufruf geladen hat (nur im Aufnahme-Modus).
+    Muss vor dem nächsten Seitenwechsel aufgerufen werden, solange Chrome die Inhalte noch vorhält.
+    entries: bereits gelesenes Performance-Log (PooledDriver.network_log()), sonst wird es hier gelesen.
+    """
+    if not RECORDING:
+        return
+    if entries is None:
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            print(f"⚠️ Snapshot: Performance-Log nicht verfügbar: {e}")
+            return
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message["params"]
+        response = params["response"]
+        if params.get("type") not in RECORDED_TYPES or response.get("status") != 200 or not response["url"].startswith("http"):
+            continue
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+        except Exception:
+            continue
+        content = base64.b64decode(body["body"]) if body.get("base64Encoded") else body["body"].encode("utf-8")
+        save(response["url"], content, response.get("mimeType") or "application/octet-stream")
+
+
+# --- Wiedergabe ---
+
+def servers():
+    """{Host: Port} der laufenden Wiedergabe-Server (auch in Worker-Prozessen)."""
+    return json.loads(os.getenv(SERVERS_ENV, "{}"))
+
+
+def rewrite(url):
+    """Original-URL -> URL des lokalen Wiedergabe-Servers (unverändert, wenn nicht im Wiedergabe-Modus)."""
+    if not REPLAYING or not url:
+        return url
+    parts = urlsplit(url)
+    port = servers().get(parts.netloc.lower())
+    if port is None:
+        return url
+    return urlunsplit(("http", f"127.0.0.1:{port}", parts.path, parts.query, parts.fragment))
+
+
+def restore(url):
+    """URL des lokalen Wiedergabe-Servers -> Original-URL."""
+    if not REPLAYING or not isinstance(url, str):
+        return url
+    parts = urlsplit(url)
+    for host, port in servers().items():
+        if parts.netloc == f"127.0.0.1:{port}":
+            return urlunsplit(("https", host, parts.path, parts.query, parts.fragment))
+    return url
+
+
+def _rewrite_content(content, hosts):
+    # Absolute Links auf aufgenommene Hosts ebenfalls auf die lokalen Server umbiegen
+    for host, port in hosts.items():
+        local = f"http://127.0.0.1:{port}".encode("utf-8")
+        for scheme in (b"https://", b"http://"):
+            content = content.replace(scheme + host.encode("utf-8"), local)
+            content = content.replace(scheme.replace(b"/", b"\\/") + host.encode("utf-8"), local.replace(b"/", b"\\/"))
+    return content
+
+
+def _handler(host):
+    class SnapshotHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            snapshot = load(f"https://{host}{self.path}") or load(f"http://{host}{self.path}")
+            if snapshot is None:
+                self.send_error(404, "Nicht im Snapshot")
+                return
+            content, content_type = snapshot
+            # HttpFetcher wertet die Seite mit den Original-URLs aus, nur Chrome braucht umgeschriebene Links
+            if not self.headers.get(RAW_HEADER) and content_type.startswith(("text/", "application/json", "application/javascript", "application/ld+json")):
+                content = _rewrite_content(content, servers())
+            with _lock:
+                _served["requests"] += 1
+                if content_type.startswith("text/html"):
+                    _served["pages"] += 1
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SnapshotHandler
+
+
+def start_replay_servers():
+    """
+    Startet pro Host in SNAPSHOT_DIR einen lokalen Server und gibt {Host: Port} zurück.
+    Die Ports landen in der Umgebung, damit die Worker-Prozesse sie erben.
+    """
+    with _lock:
+        if _servers:
+            return servers()
+        if not os.path.isdir(SNAPSHOT_DIR):
+            raise FileNotFoundError(f"Snapshot-Verzeichnis {SNAPSHOT_DIR} nicht gefunden (zuerst mit SNAPSHOT_MODE=record aufnehmen)")
+        ports = {}
+        for host in sorted(os.listdir(SNAPSHOT_DIR)):
+            if not os.path.isdir(os.path.join(SNAPSHOT_DIR, host)):
+                continue
+            server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(host))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            _servers.append(server)
+            ports[host] = server.server_address[1]
+        os.environ[SERVERS_ENV] = json.dumps(ports)
+    print(f"📼 Wiedergabe aus {SNAPSHOT_DIR}: {len(ports)} Hosts")
+    return ports
+
+
+def served_counts():
+    """Bisher von den Wiedergabe-Servern ausgelieferte Antworten: {"requests", "pages"}."""
+    with _lock:
+        return dict(_served)
+
+
+def stop_replay_servers():
+    with _lock:
+        for server in _servers:
+            server.shutdown()
+            server.server_close()
+        _servers.clear()
+        os.environ.pop(SERVERS_ENV, None)
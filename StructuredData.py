@@ -0,0 +1,267 @@
+# Liest Event-Daten direkt aus dem eingebetteten JSON einer Seite (application/ld+json, __NEXT_DATA__).
+# lu.ma und Eventbrite liefern Titel, exakte Start-/Endzeit, Ort und die komplette Beschreibung
+# schon im rohen HTML mit – ohne Rendern, ohne "View all event details"-Klick und ohne
+# dass Datumsformatierung.py den Datums-String hinterher wieder heuristisch parsen muss.
+import json
+from urllib.parse import urljoin
+
+from dateutil.parser import isoparse
+from dateutil.tz import gettz
+from lxml import html
+
+BERLIN = gettz("Europe/Berlin")
+
+
+def json_ld(tree):
+    """Alle JSON-LD-Objekte der Seite (Listen und @graph werden aufgelöst)."""
+    objects = []
+    for script in tree.xpath("//script[@type='application/ld+json']/text()"):
+        try:
+            data = json.loads(script)
+        except ValueError:
+            continue
+        pending = data if isinstance(data, list) else [data]
+        while pending:
+            obj = pending.pop(0)
+            if not isinstance(obj, dict):
+                continue
+            objects.append(obj)
+            if isinstance(obj.get("@graph"), list):
+                pending.extend(obj["@graph"])
+            if isinstance(obj.get("itemListElement"), list):
+                pending.extend(item.get("item", item) for item in obj["itemListElement"] if isinstance(item, dict))
+    return objects
+
+
+def next_data(tree):
+    """Der Seitenzustand von Next.js-Seiten (z. B. lu.ma) oder None."""
+    for script in tree.xpath("//script[@id='__NEXT_DATA__']/text()"):
+        try:
+            return json.loads(script)
+        except ValueError:
+            return None
+    return None
+
+
+def iter_dicts(obj):
+    """Alle verschachtelten Dicts eines JSON-Objekts, in Dokument-Reihenfolge."""
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, dict):
+            yield current
+            pending.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            pending.extend(reversed(current))
+
+
+def is_event(obj):
+    types = obj.get("@type", [])
+    if isinstance(types, str):
+        types = [types]
+    return any(t.endswith("Event") for t in types if isinstance(t, str))
+
+
+def format_date(value):
+    """ISO-Zeitstempel -> Format von Datumsformatierung.py (Minuten, Berliner Zeit)."""
+    if not value:
+        return None
+    try:
+        dt = isoparse(value)
+    except (ValueError, TypeError):
+        return None
+    if len(value) <= 10:
+        return dt.date().isoformat()
+    if dt.tzinfo:
+        dt = dt.astimezone(BERLIN)
+    return dt.isoformat(timespec='minutes')
+
+
+def truncate(description, cut_at=1997, max_length=2000):
+    """Kürzt Beschreibungen über max_length Zeichen auf cut_at, am letzten Leerzeichen, und hängt "..." an."""
+    if description and len(description) > max_length:
+        return description[:cut_at].rsplit(' ', 1)[0] + '...'
+    return description
+
+
+def date_range(start, end):
+    start = format_date(start)
+    end = format_date(end)
+    if start and end and end != start:
+        return f"{start} - {end}"
+    return start
+
+
+def location_text(location):
+    """schema.org Place/PostalAddress oder lu.ma geo_address_info als Text."""
+    if isinstance(location, list):
+        location = location[0] if location else None
+    if isinstance(location, str):
+        return location.strip()
+    if not isinstance(location, dict):
+        return ""
+    if location.get("@type") == "VirtualLocation":
+        return "Online"
+    if location.get("full_address"):
+        return location["full_address"].strip()
+    parts = []
+    if location.get("name"):
+        parts.append(location["name"])
+    address = location.get("address")
+    if isinstance(address, dict):
+        for key in ("streetAddress", "postalCode", "addressLocality"):
+            if address.get(key) and address[key] not in parts:
+                parts.append(address[key])
+    elif isinstance(address, str) and address not in parts:
+        parts.append(address)
+    return ", ".join(p.strip() for p in parts if p and p.strip())
+
+
+def prosemirror_text(node):
+    """Text aus einem ProseMirror-Dokument (lu.ma description_mirror), Absätze mit Zeilenumbruch."""
+    if isinstance(node, list):
+        return "".join(prosemirror_text(child) for child in node)
+    if not isinstance(node, dict):
+        return ""
+    if node.get("type") == "text":
+        return node.get("text", "")
+    text = prosemirror_text(node.get("content", []))
+    if node.get("type") in ("paragraph", "heading", "list_item", "listItem"):
+        text += "\n"
+    return text
+
+
+def find_events(tree):
+    """
+    Alle Events aus JSON-LD und __NEXT_DATA__ als einheitliche Dicts:
+    {"title", "start", "end", "location", "description", "url"}.
+    """
+    events = []
+    for obj in json_ld(tree):
+        if is_event(obj):
+            events.append({
+                "title": obj.get("name"),
+                "start": obj.get("startDate"),
+                "end": obj.get("endDate"),
+                "location": location_text(obj.get("location")),
+                "description": obj.get("description") or "",
+                "url": obj.get("url"),
+            })
+
+    data = next_data(tree)
+    if data:
+        descriptions = [prosemirror_text(d["description_mirror"]) for d in iter_dicts(data) if d.get("description_mirror")]
+        for obj in iter_dicts(data):
+            # lu.ma-Events haben eine api_id "evt-..." und start_at/end_at
+            if str(obj.get("api_id", "")).startswith("evt-") and obj.get("start_at") and obj.get("name"):
+                events.append({
+                    "title": obj.get("name"),
+                    "start": obj.get("start_at"),
+                    "end": obj.get("end_at"),
+                    "location": location_text(obj.get("geo_address_info")),
+                    "description": descriptions[0] if len(descriptions) == 1 else (obj.get("description") or ""),
+                    "url": obj.get("url"),
+                })
+    return events
+
+
+# Feldnamen, unter denen Backend-APIs (XHR/Fetch-Antworten) ihre Event-Daten liefern
+API_TITLE_KEYS = ("name", "title")
+API_START_KEYS = ("start_at", "startAt", "starts_at", "startsAt", "start_time", "startTime",
+                  "start_date", "startDate", "start_datetime", "begins_at")
+API_END_KEYS = ("end_at", "endAt", "ends_at", "endsAt", "end_time", "endTime",
+                "end_date", "endDate", "end_datetime")
+API_LOCATION_KEYS = ("location", "venue", "address", "location_name", "geo_address_info")
+API_DESCRIPTION_KEYS = ("description", "body", "content", "summary")
+API_URL_KEYS = ("url", "permalink", "public_url", "share_url", "link", "path")
+
+
+def _first(obj, keys):
+    for key in keys:
+        value = obj.get(key)
+        if value:
+            return value
+    return None
+
+
+def _api_description(value):
+    if isinstance(value, (dict, list)):
+        return prosemirror_text(value)
+    if isinstance(value, str) and "<" in value:
+        try:
+            return html.fromstring(value).text_content()
+        except Exception:
+            return value
+    return value if isinstance(value, str) else ""
+
+
+def api_events(responses, base_url):
+    """
+    Events aus den JSON-Antworten einer Seite (z. B. PooledDriver.json_responses()):
+    jedes verschachtelte Objekt mit Titel und Startzeit, als einheitliche Dicts wie find_events().
+    Dasselbe Event aus mehreren Antworten (Liste und Detail) wird zusammengeführt.
+    """
+    events = {}
+    for data in responses:
+        for obj in iter_dicts(data):
+            title = _first(obj, API_TITLE_KEYS)
+            start = _first(obj, API_START_KEYS)
+            if not isinstance(title, str) or not isinstance(start, str) or not format_date(start):
+                continue
+            location = _first(obj, API_LOCATION_KEYS)
+            if not location and (obj.get("is_online") or obj.get("online")):
+                location = "Online"
+            url = _first(obj, API_URL_KEYS)
+            event = {
+                "title": title.strip(),
+                "start": start,
+                "end": _first(obj, API_END_KEYS),
+                "location": location_text(location),
+                "description": (_api_description(_first(obj, API_DESCRIPTION_KEYS)) or "").strip(),
+                "url": urljoin(base_url, url) if isinstance(url, str) else None,
+            }
+            key = (event["title"], format_date(start))
+            known = events.setdefault(key, event)
+            # Ausführlichere Angaben aus einer späteren Antwort übernehmen
+            for field in ("end", "location", "description", "url"):
+                if event[field] and len(str(event[field])) > len(str(known[field] or "")):
+                    known[field] = event[field]
+    return list(events.values())
+
+
+def event_links(tree, base_url, prefix=None):
+    """Links aller eingebetteten Events einer Übersichtsseite (Reihenfolge bleibt erhalten)."""
+    links = []
+    for event in find_events(tree):
+        if not event["url"]:
+            continue
+        link = urljoin(base_url, event["url"])
+        if link not in links and (prefix is None or link.startswith(prefix)):
+            links.append(link)
+    return links
+
+
+def to_event(tree, link, organisation, max_length=2000, cut_at=1997):
+    """
+    Baut das Event-Dict einer Detailseite aus den eingebetteten Daten.
+    Gibt None zurück, wenn die Seite keine Event-Daten mit Titel und Startzeit enthält.
+    Der Datums-String ist bereits ISO8601 und wird von Datumsformatierung.py unverändert übernommen.
+    """
+    candidates = [event for event in find_events(tree) if event["title"] and format_date(event["start"])]
+    if not candidates:
+        return None
+    event = candidates[0]
+    # Mehrere Quellen zum selben Event: die ausführlichste Beschreibung/den Ort nehmen
+    description = max((c["description"] for c in candidates if c["title"] == event["title"]), key=len).strip()
+    location = max((c["location"] for c in candidates if c["title"] == event["title"]), key=len)
+
+    description = truncate(description or "Keine Description gefunden", cut_at, max_length)
+
+    return {
+        "Organisation": organisation,
+        "Titel": event["title"].strip(),
+        "Datum": date_range(event["start"], event["end"]),
+        "Location": location,
+        "Description": description,
+        "Link": link,
+    }
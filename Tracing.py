@@ -0,0 +1,168 @@
+# Leichtgewichtige Zeitmessung (Spans) für Seitenaufrufe, Wartezeiten, Element-Suchen,
+# Datumsformatierung und Notion-Aufrufe.
+#
+#   with Tracing.span("page_load", site="TUM", event=url):
+#       ...
+#
+# Spans sind verschachtelt (der umgebende Span ist der Parent) und erben dessen Labels, z. B. die
+# Website aus Orchestrator.run_site(). Am Ende eines Laufs schreibt export() alle Spans als JSON-Trace
+# (Chrome-Trace-Format, lesbar mit chrome://tracing oder ui.perfetto.dev) und die Summen pro Stufe und
+# Website als Prometheus-Textfile (für den node_exporter textfile collector).
+# Worker-Prozesse geben ihre Spans über Orchestrator.collect_stats() zurück; Datumsformatierung.py und
+# NotionAPI.py laufen im selben Prozess. Einzeln gestartet schreiben sie mit export_script() einen
+# eigenen Trace, der nicht in den nächsten Lauf von event-scraper.py einfließt.
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Abschalten mit TRACING=0
+ENABLED = os.getenv("TRACING", "1") != "0"
+TRACE_DIR = os.getenv("TRACE_DIR", "traces")
+TRACE_JSON = os.getenv("TRACE_JSON", os.path.join(TRACE_DIR, "trace.json"))
+TRACE_PROM = os.getenv("TRACE_PROM", os.path.join(TRACE_DIR, "event_scraper.prom"))
+
+# Labels, die in die Prometheus-Metriken übernommen werden (Event-Labels wären zu viele Zeitreihen)
+METRIC_LABELS = ["site"]
+
+_lock = threading.Lock()
+_spans = []
+_ids = itertools.count(1)
+_current = contextvars.ContextVar("tracing_span", default=None)   # (id, labels) des offenen Spans
+
+
+@contextmanager
+def span(name, **labels):
+    """Misst die Dauer des Blocks als Span mit Labels (z. B. site, event)."""
+    if not ENABLED:
+        yield
+        return
+    parent = _current.get()
+    if parent is not None:
+        labels = dict(parent[1], **labels)
+    span_id = f"{os.getpid()}-{next(_ids)}"
+    token = _current.set((span_id, labels))
+    start = time.time()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started
+        _current.reset(token)
+        with _lock:
+            _spans.append({
+                "id": span_id,
+                "parent": parent[0] if parent else None,
+                "name": name,
+                "labels": {key: str(value) for key, value in labels.items() if value is not None},
+                "start": start,
+                "duration": duration,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            })
+
+
+def drain():
+    """Gibt alle bisher gemessenen Spans dieses Prozesses zurück und leert die Liste."""
+    with _lock:
+        spans, _spans[:] = list(_spans), []
+    return spans
+
+
+def extend(spans):
+    """Übernimmt Spans aus einem anderen Prozess (z. B. einem Worker)."""
+    with _lock:
+        _spans.extend(spans)
+
+
+def _write_atomic(path, content):
+    # Erst vollständig schreiben, dann umbenennen, damit kein Leser eine halbe Datei sieht
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def prometheus_text(spans, timestamp=None):
+    """Summe, Anzahl und Maximum der Span-Dauer pro Stufe und Website im Prometheus-Textformat."""
+    totals = {}
+    for s in spans:
+        key = (s["name"],) + tuple(s["labels"].get(label, "") for label in METRIC_LABELS)
+        total = totals.setdefault(key, [0.0, 0, 0.0])
+        total[0] += s["duration"]
+        total[1] += 1
+        total[2] = max(total[2], s["duration"])
+
+    lines = [
+        "# HELP event_scraper_span_seconds Dauer der gemessenen Stufen in Sekunden.",
+        "# TYPE event_scraper_span_seconds summary",
+    ]
+    max_lines = [
+        "# HELP event_scraper_span_max_seconds Längster einzelner Span pro Stufe in Sekunden.",
+        "# TYPE event_scraper_span_max_seconds gauge",
+    ]
+    for key in sorted(totals):
+        labels = [f'span="{_escape(key[0])}"'] + [
+            f'{label}="{_escape(value)}"' for label, value in zip(METRIC_LABELS, key[1:]) if value
+        ]
+        label_text = "{" + ",".join(labels) + "}"
+        total_s, count, max_s = totals[key]
+        lines.append(f"event_scraper_span_seconds_sum{label_text} {total_s:.6f}")
+        lines.append(f"event_scraper_span_seconds_count{label_text} {count}")
+        max_lines.append(f"event_scraper_span_max_seconds{label_text} {max_s:.6f}")
+    lines += max_lines
+    lines += [
+        "# HELP event_scraper_last_run_timestamp_seconds Zeitpunkt des Exports.",
+        "# TYPE event_scraper_last_run_timestamp_seconds gauge",
+        f"event_scraper_last_run_timestamp_seconds {timestamp or time.time():.0f}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def chrome_trace(spans):
+    """Spans im Chrome-Trace-Format (ph "X" = Span mit Dauer, Zeiten in Mikrosekunden)."""
+    return {
+        "traceEvents": [
+            {
+                "name": s["name"],
+                "ph": "X",
+                "ts": round(s["start"] * 1e6),
+                "dur": round(s["duration"] * 1e6),
+                "pid": s["pid"],
+                "tid": s["tid"],
+                "args": dict(s["labels"], id=s["id"], parent=s["parent"]),
+            }
+            for s in sorted(spans, key=lambda s: s["start"])
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def export(json_path=TRACE_JSON, prom_path=TRACE_PROM):
+    """Schreibt alle Spans (dieser Prozess und Worker) als JSON-Trace und Prometheus-Textfile."""
+    if not ENABLED:
+        return
+    spans = drain()
+    _write_atomic(json_path, json.dumps(chrome_trace(spans), ensure_ascii=False))
+    _write_atomic(prom_path, prometheus_text(spans))
+    print(f"📈 {len(spans)} Spans gespeichert in {json_path} und {prom_path}")
+
+
+def export_script(name):
+    """Trace eines einzeln gestarteten Skripts (z. B. NotionAPI.py) als eigene JSON-Datei, ohne Metriken."""
+    if not ENABLED:
+        return
+    spans = drain()
+    path = os.path.join(TRACE_DIR, f"trace-{name}.json")
+    _write_atomic(path, json.dumps(chrome_trace(spans), ensure_ascii=False))
+    print(f"📈 {len(spans)} Spans gespeichert in {path}")
@@ -0,0 +1,190 @@
+# Adapter für WordPress-Seiten mit "The Events Calendar" (Tribe Events), z. B. munich-startup.de.
+# Das Plugin liefert alle Events als JSON über die REST-API (/wp-json/tribe/events/v1/events) mit
+# exakten Start-/Endzeiten, Ort und Beschreibung – statt Listen- und Detailseiten einzeln zu laden und
+# den Datums-String hinterher heuristisch zu parsen. Ist die REST-API abgeschaltet, wird der
+# iCal-Export (?ical=1) gelesen.
+#
+#   events = TribeEvents.scrape("https://www.munich-startup.de", "Munich Startup",
+#                               ical_url="https://www.munich-startup.de/veranstaltungen/?ical=1")
+import json
+import re
+from datetime import date, timedelta
+
+from lxml import html
+
+import HttpFetcher
+import StructuredData
+
+REST_PATH = "/wp-json/tribe/events/v1/events"
+PER_PAGE = 50
+# Escapes in iCal-Texten (RFC 5545): \\ \, \; \n \N
+_ESCAPE = re.compile(r"\\([\\,;nN])")
+
+
+def _text(value):
+    # Beschreibungen kommen als HTML
+    if not value:
+        return ""
+    try:
+        return html.fromstring(value).text_content().strip()
+    except Exception:
+        return str(value).strip()
+
+
+def _limit(description, max_length=2000, cut_at=1997):
+    return StructuredData.truncate(description or "Keine Description gefunden", cut_at, max_length)
+
+
+def _iso(value):
+    # "2026-05-01 16:00:00" (UTC) -> ISO mit Zeitzone
+    if not value:
+        return None
+    return value.replace(" ", "T") + "+00:00"
+
+
+def _day(value):
+    # "2026-05-01 00:00:00" (Ortszeit der Seite) -> nur das Datum
+    return value[:10] if value else None
+
+
+def venue_text(venue):
+    # Tribe liefert [] statt eines Objekts, wenn kein Ort eingetragen ist
+    if not isinstance(venue, dict):
+        return ""
+    parts = []
+    for key in ("venue", "address", "zip", "city"):
+        value = (venue.get(key) or "").strip()
+        if value and value not in parts:
+            parts.append(value)
+    return ", ".join(parts)
+
+
+def from_rest(event, organisation):
+    if event.get("all_day"):
+        # Ganztägige Events beginnen um Mitternacht Ortszeit, in UTC also z. B. schon am Vortag um 22:00
+        start, end = _day(event.get("start_date")), _day(event.get("end_date"))
+    else:
+        start, end = _iso(event.get("utc_start_date")), _iso(event.get("utc_end_date"))
+    return {
+        "Organisation": organisation,
+        "Titel": _text(event.get("title")),
+        "Datum": StructuredData.date_range(start, end),
+        "Location": venue_text(event.get("venue")),
+        "Description": _limit(_text(event.get("description"))),
+        "Link": event.get("url"),
+    }
+
+
+def _rest_page(base_url, start_date, page):
+    return (f"{base_url.rstrip('/')}{REST_PATH}?start_date={start_date}"
+            f"&per_page={PER_PAGE}&page={page}&status=publish")
+
+
+def _load(content):
+    try:
+        return json.loads(content) if content else None
+    except ValueError:
+        return None
+
+
+def scrape_rest(base_url, organisation, start_date=None):
+    """Alle Events ab start_date (Standard: heute) über die REST-API; None, wenn es keine API gibt."""
+    start_date = start_date or date.today().isoformat()
+    first = _load(HttpFetcher.fetch(_rest_page(base_url, start_date, 1)))
+    if not isinstance(first, dict) or "events" not in first:
+        return None
+
+    # Die Anzahl der Seiten steht in der ersten Antwort, der Rest wird gleichzeitig geladen
+    pages = [first]
+    total_pages = int(first.get("total_pages") or 1)
+    if total_pages > 1:
+        urls = [_rest_page(base_url, start_date, page) for page in range(2, total_pages + 1)]
+        pages.extend(_load(content) or {} for content in HttpFetcher.fetch_all(urls))
+
+    events = [from_rest(event, organisation) for page in pages for event in page.get("events", [])]
+    print(f"{organisation}: {len(events)} Events über die Tribe-REST-API ({total_pages} Seiten)")
+    return [event for event in events if event["Titel"] and event["Datum"] and event["Link"]]
+
+
+def _unescape(value):
+    # Alle Escapes in einem Durchgang auflösen, damit z. B. \\n ein Backslash plus "n" bleibt
+    return _ESCAPE.sub(lambda match: "\n" if match.group(1) in "nN" else match.group(1), value).strip()
+
+
+def _ical_date(value, params, end=False):
+    # 20260501T180000Z, 20260501T180000 (mit TZID) oder 20260501 (ganztägig)
+    if len(value) == 8:
+        day = date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        if end:
+            # Ein DTEND nur mit Datum ist exklusiv (RFC 5545): 20260502 beendet ein Event am 1. Mai
+            day -= timedelta(days=1)
+        return day.isoformat()
+    iso = f"{value[:4]}-{value[4:6]}-{value[6:8]}T{value[9:11]}:{value[11:13]}:{value[13:15]}"
+    if value.endswith("Z"):
+        return iso + "+00:00"
+    # Mit TZID (bei Tribe die Zeitzone der Seite) ohne Offset übernehmen, wie die übrigen lokalen Zeiten
+    return iso
+
+
+def parse_ical(content):
+    """VEVENTs einer iCal-Datei als Liste von Dicts (Schlüssel wie in der Datei, z. B. SUMMARY, DTSTART)."""
+    lines = []
+    for line in content.replace("\r\n", "\n").split("\n"):
+        # Umgebrochene Zeilen beginnen mit einem Leerzeichen oder Tab
+        if line[:1] in (" ", "\t") and lines:
+            lines[-1] += line[1:]
+        else:
+            lines.append(line)
+
+    events = []
+    current = None
+    for line in lines:
+        if line == "BEGIN:VEVENT":
+            current = {}
+        elif line == "END:VEVENT" and current is not None:
+            events.append(current)
+            current = None
+        elif current is not None and ":" in line:
+            name, value = line.split(":", 1)
+            key, _, params = name.partition(";")
+            if key in ("DTSTART", "DTEND"):
+                current[key] = _ical_date(value.strip(), params, end=key == "DTEND")
+            else:
+                current[key] = _unescape(value)
+    return events
+
+
+def scrape_ical(ical_url, organisation):
+    """Events aus dem iCal-Export der Seite (ohne Beschreibung als HTML, dafür immer verfügbar)."""
+    content = HttpFetcher.fetch(ical_url)
+    if not content or "BEGIN:VCALENDAR" not in content:
+        return None
+    events = []
+    for event in parse_ical(content):
+        title = event.get("SUMMARY")
+        start = event.get("DTSTART")
+        if not title or not start or not event.get("URL"):
+            continue
+        end = event.get("DTEND")
+        if end and end < start:
+            end = None
+        events.append({
+            "Organisation": organisation,
+            "Titel": title,
+            "Datum": StructuredData.date_range(start, end),
+            "Location": event.get("LOCATION", ""),
+            "Description": _limit(event.get("DESCRIPTION", "")),
+            "Link": event["URL"],
+        })
+    print(f"{organisation}: {len(events)} Events über den iCal-Export")
+    return events
+
+
+def scrape(base_url, organisation, start_date=None, ical_url=None):
+    """REST-API, sonst iCal-Export; gibt None zurück, wenn beides nicht verfügbar ist."""
+    if not HttpFetcher.FAST_PATH:
+        return None
+    events = scrape_rest(base_url, organisation, start_date)
+    if events is None and ical_url:
+        events = scrape_ical(ical_url, organisation)
+    return events
@@ -0,0 +1,97 @@
+# Bedingungsbasiertes Warten statt fester time.sleep()-Aufrufe.
+# Es wird nur so lange gewartet, bis das Element, das eine Website braucht, vorhanden ist –
+# höchstens aber bis zum Timeout der Website. Jede Wartezeit wird pro Website mitgeschrieben.
+import os
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+import Tracing
+
+# Standard-Obergrenze für eine Wartezeit in Sekunden
+DEFAULT_TIMEOUT = float(os.getenv("WAIT_TIMEOUT", "10"))
+
+# Obergrenzen pro Website (langsame Plattformen dürfen länger brauchen)
+SITE_TIMEOUTS = {
+    "AppliedAI": 15,
+    "ForTe": 15,
+    "Eventbrite": 15,
+    "LuMa": 15,
+}
+
+POLL_FREQUENCY = 0.1
+
+_lock = threading.Lock()
+_waits = {}     # Website -> Liste von (Label, Dauer in s, gefunden?)
+
+
+def timeout_for(site):
+    return SITE_TIMEOUTS.get(site, DEFAULT_TIMEOUT)
+
+
+def record(site, label, duration, found):
+    with _lock:
+        _waits.setdefault(site, []).append((label, duration, found))
+
+
+def wait_for(driver, by, selector, site, label=None, timeout=None):
+    """
+    Wartet, bis ein Element (by, selector) im DOM vorhanden ist.
+    Gibt True zurück, sobald es da ist, oder False nach Ablauf des Timeouts.
+    Ein Timeout wirft keinen Fehler – die Scraper behandeln fehlende Elemente wie bisher selbst.
+    """
+    start = time.time()
+    with Tracing.span("wait", site=site, label=label or selector):
+        try:
+            WebDriverWait(driver, timeout or timeout_for(site), poll_frequency=POLL_FREQUENCY).until(
+                EC.presence_of_element_located((by, selector))
+            )
+            found = True
+        except TimeoutException:
+            found = False
+            print(f"⚠️ {site}: Timeout beim Warten auf {label or selector}")
+    record(site, label or selector, time.time() - start, found)
+    return found
+
+
+def load(driver, url, by, selector, site, label=None, timeout=None):
+    """Ruft eine Seite auf und wartet, bis das gewünschte Element vorhanden ist."""
+    with Tracing.span("page_load", site=site, event=url):
+        driver.get(url)
+    return wait_for(driver, by, selector, site, label=label, timeout=timeout)
+
+
+def wait_gone(driver, element, site, label=None, timeout=None):
+    """Wartet, bis ein Element (z. B. ein geschlossener Cookie-Banner) unsichtbar oder entfernt ist."""
+    start = time.time()
+    with Tracing.span("wait", site=site, label=label or "invisibility"):
+        try:
+            WebDriverWait(driver, timeout or timeout_for(site), poll_frequency=POLL_FREQUENCY).until(
+                EC.invisibility_of_element(element)
+            )
+            found = True
+        except TimeoutException:
+            found = False
+    record(site, label or "invisibility", time.time() - start, found)
+    return found
+
+
+def drain_stats():
+    """Gibt die gesammelten Wartezeiten pro Website zurück und setzt sie zurück."""
+    with _lock:
+        waits = dict(_waits)
+        _waits.clear()
+    stats = {}
+    for site, entries in waits.items():
+        durations = [duration for _, duration, _ in entries]
+        stats[site] = {
+            "waits": len(entries),
+            "timeouts": sum(1 for _, _, found in entries if not found),
+            "total_s": sum(durations),
+            "mean_s": sum(durations) / len(durations),
+            "max_s": max(durations),
+        }
+    return stats
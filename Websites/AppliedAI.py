@@ -1,45 +1,106 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+# AppliedAI (community.appliedai.de) ist eine Single-Page-App, die ihre Events als JSON vom Backend lädt.
+# Im API-Modus werden diese Antworten beim einmaligen Laden der Eventliste aus dem Performance-Log von
+# Chrome gelesen (PooledDriver.json_responses()) – statt jedes Event anzuklicken und die Liste danach
+# neu zu laden (N+1 Seitenaufrufe). Nur Events ohne Beschreibung in der Liste werden einzeln geöffnet.
+# Liefern die Antworten keine verwertbaren Events, wird wie bisher geklickt.
+import os
+
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-import time
-import os
 
-def scrape():
-    # Scrapt Event-Daten von AppliedAI und gibt sie als Liste von Dictionaries zurück.
-    options = Options()
-    options.add_argument("--headless")             # Kein GUI
-    options.add_argument("--disable-gpu")          # Für Kompatibilität
-    options.add_argument("--window-size=1920,1080")# Optional für konsistentes Verhalten
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
+from DriverPool import driver_pool
+import StructuredData
+import WaitEngine
 
-    driver_path = os.getenv("CHROMEDRIVER_PATH", "/usr/local/bin/chromedriver")
-    service    = Service(driver_path)
+ORDER = 1
 
-    driver.get("https://community.appliedai.de/events?view=list")
-    time.sleep(2)
+SITE = "AppliedAI"
+LIST_URL = "https://community.appliedai.de/events?view=list"
+EVENT_CONTAINERS = "//*[@id='po-main-container']/div/div/div[2]/div/div/div/div/div[2]/div/div[2]/div"
+EVENT_TITLE = "//h1[@data-testid='event-title']"
+COOKIE_BUTTON = "/html/body/div[3]/div[2]/div/div[2]/div[1]/div[2]/button[2]/div/span"
 
-    driver = webdriver.Chrome(service=service, options=options)
+# Abschalten mit APPLIEDAI_API=0 (dann wird jedes Event angeklickt)
+API_MODE = os.getenv("APPLIEDAI_API", "1") != "0"
 
-    # Cookie-Banner ggf. schließen
+def scrape():
+    # Scrapt Event-Daten von AppliedAI und gibt sie als Liste von Dictionaries zurück.
+    # Performance-Log nur im API-Modus, dort werden die JSON-Antworten gelesen
+    driver = driver_pool.acquire(network_log=API_MODE)
     try:
-        cookie_button = driver.find_element(By.XPATH, "/html/body/div[3]/div[2]/div/div[2]/div[1]/div[2]/button[2]/div/span")
+        WaitEngine.load(driver, LIST_URL, By.XPATH, EVENT_CONTAINERS, SITE, label="Eventliste")
+
+        if API_MODE:
+            events = scrape_api(driver)
+            if events:
+                return events
+            print("⚠️ AppliedAI: keine Events in den API-Antworten gefunden, Events werden einzeln angeklickt")
+        return scrape_clicks(driver)
+    finally:
+        driver_pool.release(driver)
+
+def to_event(api_event):
+    description = api_event["description"] or "Keine Description gefunden"
+    description = StructuredData.truncate(description)
+    return {
+        "Organisation": "AppliedAI",
+        "Titel": api_event["title"],
+        "Datum": StructuredData.date_range(api_event["start"], api_event["end"]),
+        "Location": api_event["location"] or "Kein Location gefunden",
+        "Description": description,
+        "Link": api_event["url"],
+    }
+
+def scrape_api(driver):
+    # Events aus den JSON-Antworten, die beim Laden der Eventliste angefallen sind
+    responses = driver.json_responses()
+    api_events = StructuredData.api_events([data for _, data in responses], LIST_URL)
+    print(f"AppliedAI: {len(api_events)} Events aus {len(responses)} API-Antworten")
+    if not api_events or any(not event["url"] for event in api_events):
+        return []
+
+    events = []
+    detail_loads = 0
+    for api_event in api_events:
+        if not api_event["description"]:
+            detail_loads += 1
+            # Beschreibung fehlt in der Liste: nur diese Detailseite öffnen, ohne die Liste neu zu laden
+            try:
+                WaitEngine.load(driver, api_event["url"], By.XPATH, EVENT_TITLE, SITE, label="Detailseite")
+                details = StructuredData.api_events([data for _, data in driver.json_responses()], api_event["url"])
+                for detail in details:
+                    if detail["title"] == api_event["title"] and detail["description"]:
+                        api_event["description"] = detail["description"]
+                        break
+            except Exception as e:
+                print(f"AppliedAI: Details für {api_event['url']} nicht geladen: {e}")
+        events.append(to_event(api_event))
+    # Ohne Beschreibungen in der Liste ist das wieder ein Seitenaufruf pro Event
+    print(f"AppliedAI: {detail_loads} von {len(api_events)} Events ohne Beschreibung in der Liste, "
+          f"{detail_loads} Detailseiten geladen")
+    return events
+
+def dismiss_cookie_banner(driver):
+    try:
+        cookie_button = driver.find_element(By.XPATH, COOKIE_BUTTON)
         cookie_button.click()
-        time.sleep(1)
+        WaitEngine.wait_gone(driver, cookie_button, SITE, label="Cookie-Banner")
     except NoSuchElementException:
         pass
 
+def scrape_clicks(driver):
+    # Klickt jedes Event in der Liste an und liest die Detailseite aus (ohne API-Antworten)
+    dismiss_cookie_banner(driver)
+
     # Bestimme die Anzahl der Events
-    event_count = len(driver.find_elements(By.XPATH, "//*[@id='po-main-container']/div/div/div[2]/div/div/div/div/div[2]/div/div[2]/div"))
+    event_count = len(driver.find_elements(By.XPATH, EVENT_CONTAINERS))
     print(f"Gefundene Events: {event_count}")
 
     events = []
 
     for i in range(event_count):
         # Hole die Event-Container neu ab, da sich die Elemente nach einem Seiten-Reload ändern
-        event_containers = driver.find_elements(By.XPATH, "//*[@id='po-main-container']/div/div/div[2]/div/div/div/div/div[2]/div/div[2]/div")
+        event_containers = driver.find_elements(By.XPATH, EVENT_CONTAINERS)
         
         # Greife auf das aktuelle Event zu
         try:
@@ -49,23 +110,18 @@ def scrape():
             continue
 
         # Cookie-Banner ggf. erneut schließen
-        try:
-            cookie_button = driver.find_element(By.XPATH, "/html/body/div[3]/div[2]/div/div[2]/div[1]/div[2]/button[2]/div/span")
-            cookie_button.click()
-            time.sleep(1)
-        except NoSuchElementException:
-            pass
+        dismiss_cookie_banner(driver)
 
         try:
             # Verwende einen relativen XPath für den Button innerhalb des aktuellen Containers
             button = current_event.find_element(By.XPATH, ".//div[2]/div/div")
             driver.execute_script("arguments[0].click();", button)
             print(f"Event {i+1} wurde angeklickt.")
-            time.sleep(5)  # Warte, bis die Detailseite geladen ist
+            WaitEngine.wait_for(driver, By.XPATH, EVENT_TITLE, SITE, label="Detailseite")
 
             # Titel extrahieren
             try:
-                title_element = driver.find_element(By.XPATH, "//h1[@data-testid='event-title']")
+                title_element = driver.find_element(By.XPATH, EVENT_TITLE)
                 title = title_element.text.strip()
                 print(f"Event {i+1} - Titel: {title}")
             except Exception as e:
@@ -100,15 +156,7 @@ def scrape():
                 description = "Keine Description gefunden"
                 print(f"Event {i+1} - Fehler beim Extrahieren des Description: {e}")
 
-            try:
-                if len(description) > 2000:
-                    truncated = description[:1997]                         # hart auf 1997 kürzen
-                    truncated = truncated.rsplit(' ', 1)[0] + '...'        # am letzten Leerzeichen cutten und "..." anhängen
-                    description = truncated
-                else:
-                    pass
-            except Exception:
-                pass
+            description = StructuredData.truncate(description)
 
             # Link Extrahieren
             try:
@@ -129,12 +177,10 @@ def scrape():
             })
 
             # Zurück zur Event-Übersicht
-            driver.get("https://community.appliedai.de/events?view=list")
-            time.sleep(3)
+            WaitEngine.load(driver, LIST_URL, By.XPATH, EVENT_CONTAINERS, SITE, label="Eventliste")
             
         except Exception as e:
             print(f"Kein Button gefunden für Event {i+1}: {e}")
 
     #Rückgabe von den gesammelten Events an das main Programm
-    driver.quit()
     return events
\ No newline at end of file
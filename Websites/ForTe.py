@@ -1,45 +1,98 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-import time
 
-from selenium.webdriver.chrome.options import Options
-options = Options()
-options.add_argument("--headless")  # Kein GUI
-options.add_argument("--disable-gpu")  # Für Kompatibilität
-options.add_argument("--window-size=1920,1080")  # Optional für konsistentes Verhalten
+from DriverPool import driver_pool
+import HttpFetcher
+import SiteEngine
+import StructuredData
+import WaitEngine
 
-def scrape():
-    # Scraped Event-Daten von TUM und gibt sie als Liste von Directories zurück.
-    driver = webdriver.Chrome(options=options)
-    driver.get("https://events.fortefoundation.org/")
-    time.sleep(5)
+ORDER = 7
 
-    # Bestimme die Anzahl der Events
-    event_count = len(driver.find_elements(By.XPATH, "/html/body/div[1]/div/section[1]/div/div/div/div/div[5]/div")) - 2
-    print(f"Gefundene Events: {event_count}")
-
-    events = []
+SITE = "ForTe"
 
-    event_links = []
+def scrape():
+    # Scraped Event-Daten von TUM und gibt sie als Liste von Directories zurück.
+    driver = driver_pool.acquire()
+    try:
+        WaitEngine.load(driver, "https://events.fortefoundation.org/",
+                        By.XPATH, "/html/body/div[1]/div/section[1]/div/div/div/div/div[5]/div", SITE, label="Eventliste")
 
-    # Link extrahieren
-    for i in range(event_count):
-        try:
-            xpath_link = f'/html/body/div[1]/div/section[1]/div/div/div/div/div[5]/div[{i+1}]/div[2]/a'
-            link_address = driver.find_element(By.XPATH, xpath_link)
-            links = link_address.get_attribute("href")
-            print(f"Event {i+1} - Link: {links}")
-        except Exception as e:
-            links = "Kein Link gefunden"
-            print(f"Event {i+1} - Fehler beim Extrahieren des Links: {e}")
+        # Bestimme die Anzahl der Events
+        event_count = len(driver.find_elements(By.XPATH, "/html/body/div[1]/div/section[1]/div/div/div/div/div[5]/div")) - 2
+        print(f"Gefundene Events: {event_count}")
 
-        event_links.append(links)
+        event_links = []
 
-    # Jetzt über jeden Link iterieren
-    for i in range(event_count):
-        driver.get(event_links[i])
-        time.sleep(3)  # Warten, bis die Seite vollständig geladen ist
+        # Link extrahieren
+        for i in range(event_count):
+            try:
+                xpath_link = f'/html/body/div[1]/div/section[1]/div/div/div/div/div[5]/div[{i+1}]/div[2]/a'
+                link_address = driver.find_element(By.XPATH, xpath_link)
+                links = link_address.get_attribute("href")
+                print(f"Event {i+1} - Link: {links}")
+            except Exception as e:
+                links = "Kein Link gefunden"
+                print(f"Event {i+1} - Fehler beim Extrahieren des Links: {e}")
+
+            event_links.append(links)
+
+        # Detailseiten gleichzeitig per HTTP laden, nur Seiten ohne verwertbaren Inhalt mit Selenium
+        events, fallback_links = HttpFetcher.scrape_details(event_links, extract_detail)
+        events.extend(scrape_details_selenium(driver, fallback_links))
+
+        #Rückgabe von den gesammelten Events an das main Programm
+        return events
+    finally:
+        driver_pool.release(driver)
+
+def extract_detail(tree, link):
+    # Felder einer Detailseite aus dem lxml-Baum (None, wenn kein Titel gefunden wurde)
+    title = HttpFetcher.text(tree, "/html/body/div[1]/div/div/div/article/div/div[1]/div/div[3]/div/p/a/span[2]/span[2]")
+    if not title:
+        return None
+
+    # Datum: die unsichtbaren Felder sind im HTML bereits vorhanden
+    start = tree.xpath(f"//*[{HttpFetcher.has_class('evo_start')}]")
+    if start:
+        start_day = HttpFetcher.text(start[0], f".//*[{HttpFetcher.has_class('date')}]") or ""
+        start_month = (HttpFetcher.text(start[0], f".//*[{HttpFetcher.has_class('month')}]") or "").upper()
+        start_time = HttpFetcher.text(start[0], f".//*[{HttpFetcher.has_class('time')}]") or ""
+        end_time = HttpFetcher.text(tree, f"//*[{HttpFetcher.has_class('evo_end')} and {HttpFetcher.has_class('only_time')}]")
+        date_end = f"- {end_time}" if end_time else ""
+        date = f"{start_day} {start_month} {start_time} {date_end}".strip()
+    else:
+        date = "Kein Datum gefunden"
+
+    description = " ".join(
+        text for text in HttpFetcher.texts(tree, f"//*[{HttpFetcher.has_class('eventon_desc_in')}]")
+        if text not in ["REGISTER", "REGISTER [FOR FREE]"]
+    )
+    description = StructuredData.truncate(description)
+
+    return {
+        "Organisation": "ForTe",
+        "Titel": title,
+        "Datum": date,
+        "Location": " ".join(HttpFetcher.texts(tree, f"//*[{HttpFetcher.has_class('evo_location_name')}]")),
+        "Description": description,
+        "Link": link,
+    }
+
+def scrape_details_selenium(driver, event_links):
+    # Besucht jede Detailseite mit Selenium und gibt die Events zurück
+    events = []
+    for i in range(len(event_links)):
+        # Gerendertes DOM eines früheren Laufs (HttpCache) ohne Chrome auswerten
+        event = SiteEngine.cached_detail(event_links[i], extract_detail)
+        if event:
+            print(f"Event {i+1} - Titel (Cache): {event['Titel']}")
+            events.append(event)
+            continue
+
+        # Warten, bis die Datumsangaben der Detailseite geladen sind
+        WaitEngine.load(driver, event_links[i], By.CLASS_NAME, "evo_start", SITE, label="Detailseite")
+        SiteEngine.store_rendered(driver, event_links[i])
 
         # Titel extrahieren
         try:
@@ -103,15 +156,7 @@ def scrape():
             description = "Keine Description gefunden"
             print(f"Event {i+1} - Fehler beim Extrahieren des Description: {e}")
 
-        try:
-            if len(description) > 2000:
-                truncated = description[:1997]                         # hart auf 1997 kürzen
-                truncated = truncated.rsplit(' ', 1)[0] + '...'        # am letzten Leerzeichen cutten und "..." anhängen
-                description = truncated
-            else:
-                pass
-        except Exception:
-            pass
+        description = StructuredData.truncate(description)
 
         # Link Extrahieren
         try:
@@ -130,10 +175,6 @@ def scrape():
             "Location": location,
             "Description": description,
             "Link": link,
-        }) 
-
-       
+        })
 
-    #Rückgabe von den gesammelten Events an das main Programm
-    driver.quit()
-    return events
\ No newline at end of file
+    return events
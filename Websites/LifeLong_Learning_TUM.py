@@ -1,114 +1,170 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-import time
 
-from selenium.webdriver.chrome.options import Options
-options = Options()
-options.add_argument("--headless")  # Kein GUI
-options.add_argument("--disable-gpu")  # Für Kompatibilität
-options.add_argument("--window-size=1920,1080")  # Optional für konsistentes Verhalten
+from DriverPool import driver_pool
+import HttpFetcher
+import SiteEngine
+import StructuredData
+import WaitEngine
+
+ORDER = 6
+ALIASES = ["lll", "lifelong"]
+
+SITE = "LifeLong Learning TUM"
+URL = "https://www.lll.tum.de/events/"
 
 def scrape():
     # Scraped Event-Daten von TUM und gibt sie als Liste von Directories zurück.
-    driver = webdriver.Chrome(options=options)
-    driver.get("https://www.lll.tum.de/events/")
-    time.sleep(2)
-
-    # Bestimme die Anzahl der Events
-    event_count = len(driver.find_elements(By.XPATH, "//*[@id='events_query']/div/div/div"))
-    print(f"Gefundene Events: {event_count}")
+    # Die Seite wird serverseitig gerendert, daher zuerst ohne Browser versuchen.
+    events = scrape_http()
+    if events:
+        return events
+    print(f"⚠️ {SITE}: Kein verwertbarer Inhalt per HTTP, Fallback auf Selenium")
+    return scrape_selenium()
+
+def scrape_http():
+    # Gleiche Felder wie scrape_selenium(), aber per requests + lxml
+    if not HttpFetcher.FAST_PATH:
+        return []
+    tree = HttpFetcher.fetch_tree(URL)
+    if tree is None:
+        return []
+    return events_from_tree(tree)
+
+def events_from_tree(tree):
+    # Events der Eventliste aus dem lxml-Baum (per HTTP geladen oder von Chrome gerendert)
+    cards = tree.xpath("//*[@id='events_query']/div/div/div")
+    print(f"Gefundene Events (HTTP): {len(cards)}")
 
     events = []
+    for card in cards:
+        title = HttpFetcher.text(card, "./div/div[2]/p[2]") or "Kein Titel gefunden"
 
-    for i in range(event_count):
-
-        # Titel extrahieren
-        try:
-            xpath_title = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[2]/p[2]'
-            title_element = driver.find_element(By.XPATH, xpath_title)
-            title = title_element.text.strip()
-            print(f"Event {i+1} - Titel: {title}")
-        except Exception as e:
-            title = "Kein Titel gefunden"
-            print(f"Event {i+1} - Fehler beim Extrahieren des Titels: {e}")
-
-        # Datum extrahieren
-        try:
-            xpath_date = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[1]'
-            date_element = driver.find_element(By.XPATH, xpath_date)
-
-            element = driver.find_element(By.XPATH, xpath_date)
-
-            # Hole alle untergeordneten Textelemente einzeln und füge sie mit Leerzeichen zusammen
-            texts = element.find_elements(By.XPATH, './/*')
-            text_list = [t.text.strip() for t in texts if t.text.strip()]
-            date_1 = ' '.join(text_list)
-
-            xpath_extra = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[3]/p[1]'
-            extra_element = driver.find_element(By.XPATH, xpath_extra)
-            extra_text = extra_element.text.strip()
+        # Datum aus allen Unterelementen des Datumsblocks plus Uhrzeit zusammensetzen
+        extra_text = HttpFetcher.text(card, "./div/div[3]/p[1]")
+        if extra_text is None:
+            date = "Kein Datum gefunden"
+        else:
+            date_1 = ' '.join(HttpFetcher.texts(card, "./div/div[1]//*"))
+            date = f"{date_1} {extra_text.replace('Zeit:', '').strip()}"
 
-            cleaned = extra_text.replace("Zeit:", "").strip()
-            date = f"{date_1} {cleaned}"
+        description = HttpFetcher.text(card, "./div/div[2]/p[4]") or "Kein Description gefunden"
+        description = StructuredData.truncate(description)
 
-            #date = date_element.text.strip()
-            print(f"Event {i+1} - Datum: {date}")
-        except Exception as e:
-            date = "Kein Datum gefunden"
-            print(f"Event {i+1} - Fehler beim Extrahieren des Datums: {e}")
-
-        # Location
-        try:
-            xpath_location = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[2]/p[1]'
-            location_element = driver.find_element(By.XPATH, xpath_location)
-            location = location_element.text.strip()
-            print(f"Event {i+1} - Location: {location}")
-        except Exception as e:
-            location = "Kein Location gefunden"
-            print(f"Event {i+1} - Fehler beim Extrahieren der Location: {e}")
-        
-        # Description Extrahieren
-        try:
-            xpath_description = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[2]/p[4]'
-            description_element = driver.find_element(By.XPATH, xpath_description)
-            description = description_element.text.strip()
-            print(f"Event {i+1} - Description: {description}")
-        except Exception as e:
-            description = "Kein Description gefunden"
-            print(f"Event {i+1} - Fehler beim Extrahieren der Description: {e}")
-
-        try:
-            if len(description) > 2000:
-                truncated = description[:1997]                         # hart auf 1997 kürzen
-                truncated = truncated.rsplit(' ', 1)[0] + '...'        # am letzten Leerzeichen cutten und "..." anhängen
-                description = truncated
-            else:
-                pass
-        except Exception:
-            pass
-
-        # Link extrahieren
-        try:
-            xpath_link = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[3]/div/div/a'
-            link_address = driver.find_element(By.XPATH, xpath_link)
-            link = link_address.get_attribute("href")
-            print(f"Event {i+1} - Link: {link}")
-        except Exception as e:
-            link = "Kein Link gefunden"
-            print(f"Event {i+1} - Fehler beim Extrahieren des Links: {e}")
-
-
-        # Speichern in Events
         events.append({
             "Organisation": "LifeLong Learning TUM",
             "Titel": title,
             "Datum": date,
-            "Location": location,
+            "Location": HttpFetcher.text(card, "./div/div[2]/p[1]") or "Kein Location gefunden",
             "Description": description,
-            "Link": link,
+            "Link": HttpFetcher.attr(card, "./div/div[3]/div/div/a", "href") or "Kein Link gefunden",
         })
 
-    #Rückgabe von den gesammelten Events an das main Programm
-    driver.quit()
-    return events
\ No newline at end of file
+    # Ohne einen einzigen Titel ist die Seite nicht verwertbar (z. B. per JavaScript nachgeladen)
+    if not any(event["Titel"] != "Kein Titel gefunden" for event in events):
+        return []
+    return events
+
+def scrape_selenium():
+    # Gerendertes DOM eines früheren Laufs (HttpCache) ohne Chrome auswerten
+    tree = SiteEngine.rendered_tree(URL)
+    events = events_from_tree(tree) if tree is not None else []
+    if events:
+        print(f"{SITE}: Eventliste aus dem Cache")
+        return events
+
+    driver = driver_pool.acquire()
+    try:
+        WaitEngine.load(driver, URL, By.XPATH, "//*[@id='events_query']/div/div/div", SITE, label="Eventliste")
+        SiteEngine.store_rendered(driver, URL)
+
+        # Bestimme die Anzahl der Events
+        event_count = len(driver.find_elements(By.XPATH, "//*[@id='events_query']/div/div/div"))
+        print(f"Gefundene Events: {event_count}")
+
+        events = []
+
+        for i in range(event_count):
+
+            # Titel extrahieren
+            try:
+                xpath_title = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[2]/p[2]'
+                title_element = driver.find_element(By.XPATH, xpath_title)
+                title = title_element.text.strip()
+                print(f"Event {i+1} - Titel: {title}")
+            except Exception as e:
+                title = "Kein Titel gefunden"
+                print(f"Event {i+1} - Fehler beim Extrahieren des Titels: {e}")
+
+            # Datum extrahieren
+            try:
+                xpath_date = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[1]'
+                date_element = driver.find_element(By.XPATH, xpath_date)
+
+                element = driver.find_element(By.XPATH, xpath_date)
+
+                # Hole alle untergeordneten Textelemente einzeln und füge sie mit Leerzeichen zusammen
+                texts = element.find_elements(By.XPATH, './/*')
+                text_list = [t.text.strip() for t in texts if t.text.strip()]
+                date_1 = ' '.join(text_list)
+
+                xpath_extra = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[3]/p[1]'
+                extra_element = driver.find_element(By.XPATH, xpath_extra)
+                extra_text = extra_element.text.strip()
+
+                cleaned = extra_text.replace("Zeit:", "").strip()
+                date = f"{date_1} {cleaned}"
+
+                #date = date_element.text.strip()
+                print(f"Event {i+1} - Datum: {date}")
+            except Exception as e:
+                date = "Kein Datum gefunden"
+                print(f"Event {i+1} - Fehler beim Extrahieren des Datums: {e}")
+
+            # Location
+            try:
+                xpath_location = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[2]/p[1]'
+                location_element = driver.find_element(By.XPATH, xpath_location)
+                location = location_element.text.strip()
+                print(f"Event {i+1} - Location: {location}")
+            except Exception as e:
+                location = "Kein Location gefunden"
+                print(f"Event {i+1} - Fehler beim Extrahieren der Location: {e}")
+        
+            # Description Extrahieren
+            try:
+                xpath_description = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[2]/p[4]'
+                description_element = driver.find_element(By.XPATH, xpath_description)
+                description = description_element.text.strip()
+                print(f"Event {i+1} - Description: {description}")
+            except Exception as e:
+                description = "Kein Description gefunden"
+                print(f"Event {i+1} - Fehler beim Extrahieren der Description: {e}")
+
+            description = StructuredData.truncate(description)
+
+            # Link extrahieren
+            try:
+                xpath_link = f'//*[@id="events_query"]/div/div/div[{i+1}]/div/div[3]/div/div/a'
+                link_address = driver.find_element(By.XPATH, xpath_link)
+                link = link_address.get_attribute("href")
+                print(f"Event {i+1} - Link: {link}")
+            except Exception as e:
+                link = "Kein Link gefunden"
+                print(f"Event {i+1} - Fehler beim Extrahieren des Links: {e}")
+
+
+            # Speichern in Events
+            events.append({
+                "Organisation": "LifeLong Learning TUM",
+                "Titel": title,
+                "Datum": date,
+                "Location": location,
+                "Description": description,
+                "Link": link,
+            })
+
+        #Rückgabe von den gesammelten Events an das main Programm
+        return events
+    finally:
+        driver_pool.release(driver)
\ No newline at end of file
@@ -1,136 +1,299 @@
-from selenium import webdriver
+import os
+import re
+
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-import time
 
-from selenium.webdriver.chrome.options import Options
-options = Options()
-options.add_argument("--headless")  # Kein GUI
-options.add_argument("--disable-gpu")  # Für Kompatibilität
-options.add_argument("--window-size=1920,1080")  # Optional für konsistentes Verhalten
+from DriverPool import driver_pool
+import HttpFetcher
+import SiteEngine
+import StructuredData
+import TribeEvents
+import WaitEngine
+
+ORDER = 5
+ALIASES = ["munich", "munichstartup"]
+
+SITE = "Munich Startup"
+LIST_URL = 'https://www.munich-startup.de/veranstaltungen/liste/?tribe_paged={Seite}&tribe_event_display=list&tribe-bar-date={heute}'
+XPATH_LIST = "/html/body/div[1]/main/div[1]/div/div[2]/div[2]/div/div[1]/div"
+XPATH_TITLE = "/html/body/div[1]/main/div/div/div[2]/div[4]/div[1]/div/div[1]/h1"
+XPATH_DATES = "/html/body/div[1]/main/div/div/div[2]/div[4]/div[1]/div/div[2]/div/div[1]/dl/dd/abbr"
+XPATH_LOCATION = "/html/body/div[1]/main/div/div/div[2]/div[4]/div[2]/div/div/div/address/span"
+
+# Listenseiten, die gleichzeitig geladen werden, bevor der Paginator ausgewertet wird
+PAGE_WINDOW = int(os.getenv("MUNICH_STARTUP_PAGE_WINDOW", "4"))
+# Obergrenze, falls der Paginator nie endet
+MAX_PAGES = int(os.getenv("MUNICH_STARTUP_MAX_PAGES", "30"))
+# munich-startup.de läuft mit "The Events Calendar": erst REST-API bzw. iCal-Export (TribeEvents.py),
+# abschalten mit MUNICH_STARTUP_API=0
+API_MODE = os.getenv("MUNICH_STARTUP_API", "1") != "0"
+BASE_URL = "https://www.munich-startup.de"
+ICAL_URL = "https://www.munich-startup.de/veranstaltungen/?ical=1"
+PAGE_NUMBER = re.compile(r"[?&]tribe_paged=(\d+)|/page/(\d+)/?")
 
 def scrape():
-    
+    # Scraped Event-Daten von Munich Startup und gibt sie als Liste von Directories zurück.
+    # Zuerst die strukturierten Feeds des Kalender-Plugins, dann die Listen- und Detailseiten ohne Browser.
+    if API_MODE:
+        events = TribeEvents.scrape(BASE_URL, "Munich Startup", ical_url=ICAL_URL)
+        if events:
+            return events
+        print(f"⚠️ {SITE}: Keine Events über REST-API/iCal, lese die Listenseiten")
+    events = scrape_http()
+    if events:
+        return events
+    print(f"⚠️ {SITE}: Kein verwertbarer Inhalt per HTTP, Fallback auf Selenium")
+    return scrape_selenium()
+
+def scrape_http():
+    # Gleiche Felder wie scrape_selenium(), aber per requests + lxml.
+    # Detailseiten ohne verwertbaren Inhalt werden anschließend mit Selenium nachgeladen.
+    if not HttpFetcher.FAST_PATH:
+        return []
+
+    from datetime import date
+    heute = date.today().isoformat()
+
+    # Alle Links der Listenseiten sammeln, dann die Detailseiten gleichzeitig laden
+    event_links = listing_links_http(heute)
+    events, fallback_links = HttpFetcher.scrape_details(event_links, extract_detail)
+
+    if fallback_links and events:
+        print(f"⚠️ {SITE}: {len(fallback_links)} Detailseiten ohne verwertbaren Inhalt, Fallback auf Selenium")
+        driver = driver_pool.acquire()
+        try:
+            events.extend(scrape_details_selenium(driver, fallback_links))
+        finally:
+            driver_pool.release(driver)
+    return events
+
+def last_page(tree):
+    # Höchste Seitenzahl, auf die der Paginator der Listenseite verlinkt (1, wenn es keinen gibt)
+    numbers = [1]
+    for href in tree.xpath("//a/@href"):
+        match = PAGE_NUMBER.search(href)
+        if match:
+            numbers.append(int(match.group(1) or match.group(2)))
+    return max(numbers)
+
+def listing_links(tree):
+    # Links der Events einer Listenseite; der erste Container ist die Überschrift
+    containers = tree.xpath(XPATH_LIST)[1:]
+    print(f"Gefundene Events (HTTP): {len(containers)}")
+    links = []
+    for container in containers:
+        link = HttpFetcher.attr(container, "./div[last()]/h3/a", "href")
+        if link:
+            links.append(link)
+    return links
+
+def listing_tree_selenium(url):
+    # Listenseite, deren HTTP-Abruf fehlgeschlagen ist, mit Chrome laden (None, wenn auch das scheitert)
+    driver = driver_pool.acquire()
+    try:
+        WaitEngine.load(driver, url, By.XPATH, XPATH_LIST, SITE, label="Eventliste")
+        return HttpFetcher.parse(driver.page_source, url)
+    except Exception as e:
+        print(f"⚠️ {SITE}: Listenseite auch mit Selenium nicht geladen: {e}")
+        return None
+    finally:
+        driver_pool.release(driver)
+
+def listing_links_http(heute):
+    # Lädt die Listenseiten blockweise gleichzeitig (PAGE_WINDOW Seiten auf einmal) und gibt alle Event-Links zurück.
+    # Die Seitenzahl kommt aus dem Paginator; abgebrochen wird erst an einer geladenen Seite ohne neue Links.
+    # Seiten, deren Abruf fehlschlägt, werden mit Selenium nachgeladen statt als Ende der Liste gewertet.
+    event_links = []
+    first, last = 1, PAGE_WINDOW
+    while first <= min(last, MAX_PAGES):
+        numbers = range(first, min(last, MAX_PAGES) + 1)
+        urls = [LIST_URL.format(Seite=Seite, heute=heute) for Seite in numbers]
+        loaded = []
+        for Seite, url, tree in zip(numbers, urls, HttpFetcher.fetch_trees(urls)):
+            if tree is None:
+                print(f"⚠️ {SITE}: Listenseite {Seite} per HTTP nicht geladen, Fallback auf Selenium")
+                tree = listing_tree_selenium(url)
+            if tree is None:
+                print(f"❌ {SITE}: Listenseite {Seite} nicht geladen, ihre Events fehlen")
+                continue
+            loaded.append(tree)
+            links = [link for link in listing_links(tree) if link not in event_links]
+            if not links:
+                return event_links
+            event_links.extend(links)
+        if not loaded:
+            print(f"❌ {SITE}: Keine der Listenseiten {numbers[0]}-{numbers[-1]} geladen, breche ab")
+            return event_links
+        # Der Paginator der letzten Seite zeigt, ob (und wie viele) weitere Seiten folgen;
+        # fehlt sie, wird mit dem nächsten Block weitergemacht, bis eine geladene Seite leer ist
+        known = last_page(tree) if tree is not None else numbers[-1] + 1
+        if known <= numbers[-1]:
+            return event_links
+        first, last = numbers[-1] + 1, max(known, numbers[-1] + PAGE_WINDOW)
+    return event_links
+
+def extract_detail(detail, link):
+    # Felder einer Detailseite aus dem lxml-Baum (None, wenn kein Titel gefunden wurde)
+    title = HttpFetcher.text(detail, XPATH_TITLE)
+    if not title:
+        return None
+
+    description = HttpFetcher.text(detail, f"//*[{HttpFetcher.has_class('entry-content')}]") or "Keine Description gefunden"
+    description = StructuredData.truncate(description)
+
+    return {
+        "Organisation": "Munich Startup",
+        "Titel": title,
+        "Datum": " - ".join(HttpFetcher.texts(detail, XPATH_DATES)),
+        "Location": HttpFetcher.text(detail, XPATH_LOCATION) or "",
+        "Description": description,
+        "Link": link,
+    }
+
+def scrape_selenium():
+
     # Aktuelles Datum abrufen
     from datetime import date
     heute = date.today().isoformat()
     print(heute)  # z.B. 2025-03-21
 
-    # Scraped Event-Daten von TUM und gibt sie als Liste von Directories zurück.
-    driver = webdriver.Chrome(options=options)
-    url_heute = f'https://www.munich-startup.de/veranstaltungen/liste/?tribe_paged=1&tribe_event_display=list&tribe-bar-date={heute}'
-    driver.get(url_heute)
-    time.sleep(2)
-
-    # Cookie-Banner schließen
+    driver = driver_pool.acquire()
     try:
-        cookie_button = driver.find_element(By.XPATH, "//*[@id='BorlabsCookieBox']/div/div/div[2]/div/div/div[2]/div/div/div/div/div/div/div[3]/div/div[1]/button")
-        cookie_button.click()
-        time.sleep(2)
-    except NoSuchElementException:
-        pass
+        url_heute = LIST_URL.format(Seite=1, heute=heute)
+        WaitEngine.load(driver, url_heute, By.ID, "BorlabsCookieBox", SITE, label="Cookie-Banner")
 
-    events = []
+        # Cookie-Banner schließen
+        try:
+            cookie_button = driver.find_element(By.XPATH, "//*[@id='BorlabsCookieBox']/div/div/div[2]/div/div/div[2]/div/div/div/div/div/div/div[3]/div/div[1]/button")
+            cookie_button.click()
+            WaitEngine.wait_gone(driver, cookie_button, SITE, label="Cookie-Banner")
+        except NoSuchElementException:
+            pass
 
-    for Seite in range(1, 5):
-        url_Seite = f'https://www.munich-startup.de/veranstaltungen/liste/?tribe_paged={Seite}&tribe_event_display=list&tribe-bar-date={heute}'
-        driver.get(url_Seite)
-        time.sleep(2)
-
-        # Bestimme die Anzahl der Events
-        event_count = len(driver.find_elements(By.XPATH, "/html/body/div[1]/main/div[1]/div/div[2]/div[2]/div/div[1]/div")) - 1
-        print(f"Gefundene Events: {event_count}")
-
-        # Zuerst alle Events-Links sammeln
-        event_links = []
-        for i in range(1, event_count + 1):
-            xpath_event_container_links_div_unfiltered = f'/html/body/div[1]/main/div[1]/div/div[2]/div[2]/div/div[1]/div[{i+1}]/div'
-            event_container_links_div_elements = driver.find_elements(By.XPATH, xpath_event_container_links_div_unfiltered)
-            event_container_links_div_amount = len(event_container_links_div_elements)
-            xpath_event_container_links_div_filtered = f'/html/body/div[1]/main/div[1]/div/div[2]/div[2]/div/div[1]/div[{i+1}]/div[{event_container_links_div_amount}]/h3/a'
-            try:
-                link = driver.find_element(By.XPATH, xpath_event_container_links_div_filtered)
-            except Exception:
-                link = ""
-            try:
-                event_links.append(link.get_attribute("href"))
-            except Exception:
-                driver.quit()
-                return events        
-            
-        #Jetzt über jeden Link iterieren
-        for i in range(event_count):
-            driver.get(event_links[i])
-            time.sleep(3)  # Warten, bis die Seite vollständig geladen ist
-
-            # Titel extrahieren
-            try:
-                title_element = driver.find_element(By.XPATH, "/html/body/div[1]/main/div/div/div[2]/div[4]/div[1]/div/div[1]/h1")
-                title = title_element.text.strip()
-                print(f"Event {i+1} - Titel: {title}")
-            except Exception as e:
-                title = "Kein Titel gefunden"
-                print(f"Event {i+1} - Fehler beim Extrahieren des Titels: {e}")
+        events = []
 
-            # Datum extrahieren 
-            try:
-                #date_elements = driver.find_elements(By.XPATH, "/html/body/div[1]/main/div/div/div[2]/div[4]/div[1]/div/div[2]/div/div[1]/dl/dd[1]/abbr")
-                #date = date_elements.text.strip()
-                date_elements = driver.find_elements(By.XPATH, "/html/body/div[1]/main/div/div/div[2]/div[4]/div[1]/div/div[2]/div/div[1]/dl/dd/abbr")
-                date_list = [elem.text.strip() for elem in date_elements if elem.text.strip()]
-                date = " - ".join(date_list)
-                print(f"Event {i+1} - Datum: {date}")
-            except Exception as e:
-                date = "Kein Datum gefunden"
-                print(f"Event {i+1} - Fehler beim Extrahieren des Datums: {e}")
-            
-            # Location extrahieren
+        Seite = 1
+        while Seite <= MAX_PAGES:
+            url_Seite = LIST_URL.format(Seite=Seite, heute=heute)
             try:
-                location_element = driver.find_element(By.XPATH, "/html/body/div[1]/main/div/div/div[2]/div[4]/div[2]/div/div/div/address/span")
-                location = location_element.text.strip()
-                print(f"Event {i+1} - Location: {location}")
+                WaitEngine.load(driver, url_Seite, By.XPATH, XPATH_LIST, SITE, label="Eventliste")
             except Exception as e:
-                location = ""
-                #location = "Kein Location gefunden"
-                print(f"Event {i+1} - Fehler beim Extrahieren der Location: {e}")
+                print(f"Eventliste Seite {Seite} nicht geladen: {e}")
+                break
 
-            # Description Extrahieren
-            try:
-                description_element = driver.find_element(By.CLASS_NAME, "entry-content")
-                description = description_element.text.strip()
-                print(f"Event {i+1} - Description: {description[:50]}")
-            except Exception as e:
-                description = "Keine Description gefunden"
-                print(f"Event {i+1} - Fehler beim Extrahieren des Description: {e}")
-            try:
-                if len(description) > 2000:
-                    truncated = description[:1997]                         # hart auf 1997 kürzen
-                    truncated = truncated.rsplit(' ', 1)[0] + '...'        # am letzten Leerzeichen cutten und "..." anhängen
-                    description = truncated
-                else:
-                    pass
-            except Exception:
-                pass
-
-            # Link Extrahieren
-            try:
-                link = driver.current_url
-                print(f"Event {i+1} - Link: {link}")
-            except Exception as e:
-                link = "Kein Link gefunden"
-                print(f"Event {i+1} - Fehler beim Extrahieren des Links: {e}")
-
-            # Speichern in Events
-            events.append({
-                "Organisation": "Munich Startup",
-                "Titel": title,
-                "Datum": date,
-                "Location": location,
-                "Description": description,
-                "Link": link,
-            })
-
-
-    #Rückgabe von den gesammelten Events an das main Programm
-    driver.quit()
-    return events
\ No newline at end of file
+            # Bestimme die Anzahl der Events, an der ersten leeren Seite aufhören
+            event_count = len(driver.find_elements(By.XPATH, XPATH_LIST)) - 1
+            print(f"Gefundene Events: {event_count}")
+            if event_count <= 0:
+                break
+
+            # Zuerst alle Events-Links sammeln, Container ohne lesbaren Link überspringen
+            event_links = []
+            for i in range(1, event_count + 1):
+                xpath_event_container_links_div_unfiltered = f'/html/body/div[1]/main/div[1]/div/div[2]/div[2]/div/div[1]/div[{i+1}]/div'
+                event_container_links_div_elements = driver.find_elements(By.XPATH, xpath_event_container_links_div_unfiltered)
+                event_container_links_div_amount = len(event_container_links_div_elements)
+                xpath_event_container_links_div_filtered = f'/html/body/div[1]/main/div[1]/div/div[2]/div[2]/div/div[1]/div[{i+1}]/div[{event_container_links_div_amount}]/h3/a'
+                try:
+                    link = driver.find_element(By.XPATH, xpath_event_container_links_div_filtered).get_attribute("href")
+                except Exception:
+                    print(f"Event {i} auf Seite {Seite}: kein Link gefunden")
+                    continue
+                if link:
+                    event_links.append(link)
+
+            # Gibt es laut Paginator eine weitere Seite?
+            pages = [1]
+            for element in driver.find_elements(By.XPATH, "//a[contains(@href, 'tribe_paged=') or contains(@href, '/page/')]"):
+                match = PAGE_NUMBER.search(element.get_attribute("href") or "")
+                if match:
+                    pages.append(int(match.group(1) or match.group(2)))
+
+            #Jetzt über jeden Link iterieren
+            events.extend(scrape_details_selenium(driver, event_links))
+
+            if max(pages) <= Seite:
+                break
+            Seite += 1
+
+        #Rückgabe von den gesammelten Events an das main Programm
+        return events
+    finally:
+        driver_pool.release(driver)
+
+def scrape_details_selenium(driver, event_links):
+    # Besucht jede Detailseite mit Selenium und gibt die Events zurück
+    events = []
+    for i in range(len(event_links)):
+        # Gerendertes DOM eines früheren Laufs (HttpCache) ohne Chrome auswerten
+        event = SiteEngine.cached_detail(event_links[i], extract_detail)
+        if event:
+            print(f"Event {i+1} - Titel (Cache): {event['Titel']}")
+            events.append(event)
+            continue
+
+        # Warten, bis der Titel der Detailseite geladen ist
+        WaitEngine.load(driver, event_links[i], By.XPATH, XPATH_TITLE, SITE, label="Detailseite")
+        SiteEngine.store_rendered(driver, event_links[i])
+
+        # Titel extrahieren
+        try:
+            title_element = driver.find_element(By.XPATH, XPATH_TITLE)
+            title = title_element.text.strip()
+            print(f"Event {i+1} - Titel: {title}")
+        except Exception as e:
+            title = "Kein Titel gefunden"
+            print(f"Event {i+1} - Fehler beim Extrahieren des Titels: {e}")
+
+        # Datum extrahieren 
+        try:
+            #date_elements = driver.find_elements(By.XPATH, "/html/body/div[1]/main/div/div/div[2]/div[4]/div[1]/div/div[2]/div/div[1]/dl/dd[1]/abbr")
+            #date = date_elements.text.strip()
+            date_elements = driver.find_elements(By.XPATH, XPATH_DATES)
+            date_list = [elem.text.strip() for elem in date_elements if elem.text.strip()]
+            date = " - ".join(date_list)
+            print(f"Event {i+1} - Datum: {date}")
+        except Exception as e:
+            date = "Kein Datum gefunden"
+            print(f"Event {i+1} - Fehler beim Extrahieren des Datums: {e}")
+        
+        # Location extrahieren
+        try:
+            location_element = driver.find_element(By.XPATH, XPATH_LOCATION)
+            location = location_element.text.strip()
+            print(f"Event {i+1} - Location: {location}")
+        except Exception as e:
+            location = ""
+            #location = "Kein Location gefunden"
+            print(f"Event {i+1} - Fehler beim Extrahieren der Location: {e}")
+
+        # Description Extrahieren
+        try:
+            description_element = driver.find_element(By.CLASS_NAME, "entry-content")
+            description = description_element.text.strip()
+            print(f"Event {i+1} - Description: {description[:50]}")
+        except Exception as e:
+            description = "Keine Description gefunden"
+            print(f"Event {i+1} - Fehler beim Extrahieren des Description: {e}")
+        description = StructuredData.truncate(description)
+
+        # Link Extrahieren
+        try:
+            link = driver.current_url
+            print(f"Event {i+1} - Link: {link}")
+        except Exception as e:
+            link = "Kein Link gefunden"
+            print(f"Event {i+1} - Fehler beim Extrahieren des Links: {e}")
+
+        # Speichern in Events
+        events.append({
+            "Organisation": "Munich Startup",
+            "Titel": title,
+            "Datum": date,
+            "Location": location,
+            "Description": description,
+            "Link": link,
+        })
+
+    return events
@@ -7,12 +7,21 @@ required_packages = [
     "selenium",
     "webdriver-manager",
     "pandas",
-    "openpyxl"  # wird für Excel-Export mit pandas benötigt
+    "openpyxl",  # wird für den Excel-Export (--excel) benötigt
+    "lxml",      # HTTP-Schnellpfad (HttpFetcher.py)
+    "pyarrow",   # Parquet-Zwischenergebnisse (Artifacts.py)
+    "numpy",     # MinHash-Signaturen (NearDuplicates.py)
+    "python-dateutil",  # Datumsformatierung.py, StructuredData.py
 ]
 
+# Pakete, deren Modulname nicht aus dem Paketnamen folgt
+import_names = {
+    "python-dateutil": "dateutil",
+}
+
 for package in required_packages:
     try:
-        importlib.import_module(package.replace("-", "_"))
+        importlib.import_module(import_names.get(package, package.replace("-", "_")))
     except ImportError:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package])
 
@@ -42,59 +51,75 @@ options.add_argument("--disable-dev-shm-usage")
 
 #driver = webdriver.Chrome(service=Service("/usr/local/bin/chromedriver"), options=options)
 
-#import the scripts of the Websites to be included in the final excel
-import Websites.LifeLong_Learning_TUM as AppliedAI
-import Websites.TUM as TUM
-import Websites.TUM_Venture_Labs as TUM_Venture_Labs
-import Websites.Social_Startup_hub as Social_Startup_hub
-import Websites.Munich_Startup as Munich_Startup
-import Websites.LifeLong_Learning_TUM as LifeLong_Learning_TUM
-import Websites.LifeLong_Learning_TUM as ForTe
-import Websites.TUM_Venture_Labs_Eventbride as TUM_Venture_Labs_Eventbride
-import Websites.TUM_Venture_Labs_LuMa as TUM_Venture_Labs_LuMa
-
-# Event-Daten sammeln
-all_events = []
-
-all_events.extend(AppliedAI.scrape())
-all_events.extend(TUM.scrape())
-all_events.extend(TUM_Venture_Labs.scrape())
-all_events.extend(Social_Startup_hub.scrape())
-all_events.extend(Munich_Startup.scrape())
-all_events.extend(LifeLong_Learning_TUM.scrape())
-all_events.extend(ForTe.scrape())
-all_events.extend(TUM_Venture_Labs_Eventbride.scrape())
-all_events.extend(TUM_Venture_Labs_LuMa.scrape())
-
-seen = set()
-unique_events = []
-for event in all_events:
-    key = (
-        event['Organisation'],
-        event['Titel'],
-        event['Datum'],
-        event['Location'],
-        event['Description']
-    )
-    if key not in seen:
-        unique_events.append(event)
-        seen.add(key)
-
-all_events = unique_events
-
-# --- In CSV speichern ---
-df = pd.DataFrame(all_events)
-df.to_csv("scraped_events.csv", index=False, encoding="utf-8")
-print(f"{len(all_events)} Events gespeichert in 'scraped_events.csv'")
-
-# In Excel speichern
-df = pd.DataFrame(all_events)
-df.to_excel("scraped_events.xlsx", index=False)
-print(f"{len(all_events)} Events gespeichert in 'scraped_events.xlsx'")
-
-# Datumsformatierung in Datumsformatierung.py vornehmen
-#all_events = Datumsformatierung.process_events(all_events)
-subprocess.check_call([sys.executable, "Datumsformatierung.py"])
-
-# NotionAPI.py als Subskript ausführen
-subprocess.check_call([sys.executable, "NotionAPI.py"])
\ No newline at end of file
+# Websites stehen in SiteRegistry.py und werden erst im Worker-Prozess importiert
+import argparse
+import Artifacts
+import Datumsformatierung
+import NearDuplicates
+import NotionAPI
+import Orchestrator
+import Pipeline
+import Tracing
+from SiteRegistry import registry
+
+if __name__ == "__main__":
+    # Emojis in den Ausgaben auch auf Konsolen ohne UTF-8 (z. B. Windows)
+    sys.stdout.reconfigure(encoding='utf-8')
+    parser = argparse.ArgumentParser(description="Scraped Events aller (oder ausgewählter) Websites.")
+    parser.add_argument("--sites", help="Kommagetrennte Auswahl, z. B. --sites tum,luma (Standard: alle)")
+    parser.add_argument("--list-sites", action="store_true", help="Registrierte Websites anzeigen und beenden")
+    parser.add_argument("--stream", action="store_true",
+                        help="Events einzeln bis nach Notion durchreichen, statt auf alle Websites zu warten (Pipeline.py)")
+    parser.add_argument("--excel", nargs="?", const="scraped_events_formatted.xlsx", metavar="PFAD",
+                        help="Am Ende zusätzlich eine Excel-Datei für Menschen schreiben (Standard: scraped_events_formatted.xlsx)")
+    args = parser.parse_args()
+
+    if args.list_sites:
+        for name, module_path in registry.select():
+            short_names = sorted(key for key, site in registry.aliases.items() if site == name)
+            print(f"{name:<30} {module_path:<45} {', '.join(short_names)}")
+        sys.exit(0)
+
+    try:
+        sites = registry.select(args.sites.split(",") if args.sites else None)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.stream:
+        # Aufnahme/Wiedergabe von Snapshots (SNAPSHOT_MODE) läuft offline, dann nichts nach Notion hochladen
+        Pipeline.run(sites, upload_to_notion=not os.getenv("SNAPSHOT_MODE"))
+        if args.excel:
+            Artifacts.write_excel(Artifacts.read_events(Artifacts.FORMATTED_PATH), args.excel)
+        Tracing.export()
+        sys.exit(0)
+
+    # Event-Daten sammeln (parallel, Anzahl Worker über SCRAPER_WORKERS)
+    all_events = Orchestrator.run_all(sites)
+
+    # Zwischenstand als Parquet (Artifacts.py), Datumsformatierung.py kann damit auch einzeln neu laufen
+    Artifacts.write_events(all_events, Artifacts.SCRAPED_PATH)
+
+    # Datumsformatierung (Datumsformatierung.py), die Events bleiben im Speicher
+    all_events = Datumsformatierung.process_events(all_events)
+
+    # Doppelte Events entfernen (Link, Titel und Startdatum normiert, Index über Läufe in Dedup.py)
+    all_events = list(Pipeline.dedup(all_events))
+    # Dasselbe Event auf mehreren Plattformen nur einmal, mit den meisten Angaben (NearDuplicates.py)
+    all_events = NearDuplicates.collapse(all_events)
+    print(f"{len(all_events)} Events nach dem Entfernen von Duplikaten")
+    Artifacts.write_events(all_events, Artifacts.FORMATTED_PATH)
+    if args.excel:
+        Artifacts.write_excel(all_events, args.excel)
+
+    # Aufnahme/Wiedergabe von Snapshots (SNAPSHOT_MODE) läuft offline, dann nichts nach Notion hochladen
+    if os.getenv("SNAPSHOT_MODE"):
+        print("📼 Snapshot-Modus: Upload nach Notion übersprungen")
+        Tracing.export()
+        sys.exit(0)
+
+    # Events, die schon in Notion stehen, aussortieren und den Rest hochladen (NotionAPI.py)
+    new_events = NotionAPI.filter_new_events(all_events)
+    NotionAPI.upload_events(new_events)
+
+    # Zeitmessungen aller Stufen als JSON-Trace und Prometheus-Textfile speichern
+    Tracing.export()
@@ -0,0 +1,32 @@
+# Prüft StructuredData.api_events gegen aufgenommene Backend-Antworten von AppliedAI (Snapshots-Fixture).
+# Aufnehmen (mit Chrome und Netzwerk):
+#   SNAPSHOT_MODE=record python event-scraper.py --sites appliedai
+#   mkdir -p tests/fixtures/snapshots && cp -r snapshots/community.appliedai.de tests/fixtures/snapshots/
+import os
+
+import pytest
+
+import Snapshots
+import StructuredData
+from Websites import AppliedAI
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "snapshots")
+HOST = "community.appliedai.de"
+
+responses = Snapshots.json_responses(HOST, FIXTURE_DIR)
+pytestmark = pytest.mark.skipif(not responses, reason=f"Keine aufgenommenen Antworten unter {FIXTURE_DIR}/{HOST}")
+
+
+def test_list_responses_contain_events():
+    events = StructuredData.api_events([data for _, data in responses], AppliedAI.LIST_URL)
+    assert events
+    for event in events:
+        assert event["title"]
+        assert StructuredData.format_date(event["start"])
+        assert event["url"] and event["url"].startswith(f"https://{HOST}/")
+
+
+def test_list_responses_contain_descriptions():
+    # Sonst lädt scrape_api() wieder eine Detailseite pro Event
+    events = StructuredData.api_events([data for _, data in responses], AppliedAI.LIST_URL)
+    assert any(event["description"] for event in events)
@@ -0,0 +1,38 @@
+# Tests für NearDuplicates.py: Reihen einer Website bleiben getrennt, Kopien auf anderen Plattformen nicht
+import NearDuplicates
+
+SERIES = [
+    {"Organisation": "TUM Venture Labs", "Titel": f"Event {i}", "Datum": "2026-05-01T18:00",
+     "Link": f"https://lu.ma/event-{i}"} for i in range(3)
+] + [
+    {"Organisation": "TUM Venture Labs", "Titel": f"Pitch Training Part {i}", "Datum": "2026-05-02T18:00",
+     "Link": f"https://lu.ma/pitch-{i}"} for i in (1, 2)
+] + [
+    {"Organisation": "Munich Startup", "Titel": f"AI Meetup #{i}", "Datum": "2026-05-03T18:00",
+     "Link": f"https://www.munich-startup.de/veranstaltungen/ai-meetup-{i}/"} for i in (3, 4)
+]
+
+COPIES = [
+    {"Organisation": "TUM Venture Labs", "Titel": "TUM Venture Labs: Pitch Night 2026", "Datum": "2026-05-01T18:00",
+     "Link": "https://lu.ma/pitch-night", "Description": ""},
+    {"Organisation": "TUM Venture Labs", "Titel": "TUM Venture Labs – Pitch Night 2026", "Datum": "2026-05-01T18:30",
+     "Link": "https://www.eventbrite.de/e/pitch-night", "Description": "Ausführliche Beschreibung"},
+]
+
+
+def test_series_survives_collapse():
+    assert NearDuplicates.collapse(SERIES) == SERIES
+
+
+def test_series_survives_drop():
+    assert list(NearDuplicates.drop(SERIES)) == SERIES
+
+
+def test_copies_collapse_to_richest_event():
+    kept = NearDuplicates.collapse(COPIES)
+    assert len(kept) == 1
+    assert kept[0]["Link"] == "https://www.eventbrite.de/e/pitch-night"
+
+
+def test_copies_drop_keeps_first_event():
+    assert list(NearDuplicates.drop(COPIES)) == COPIES[:1]
@@ -0,0 +1,107 @@
+# Tests für TribeEvents.py mit festen Antworten statt der Live-Feeds von munich-startup.de
+import json
+
+import Datumsformatierung
+import HttpFetcher
+import TribeEvents
+
+ICAL = "\r\n".join([
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "BEGIN:VEVENT",
+    "DTSTART;VALUE=DATE:20260501",
+    "DTEND;VALUE=DATE:20260502",
+    "SUMMARY:Startup Tag",
+    "URL:https://www.munich-startup.de/veranstaltungen/startup-tag/",
+    "LOCATION:Werksviertel\\, München",
+    "DESCRIPTION:Erste Zeile\\nZweite Zeile mit C:\\\\new",
+    "END:VEVENT",
+    "BEGIN:VEVENT",
+    "DTSTART;VALUE=DATE:20260510",
+    "DTEND;VALUE=DATE:20260513",
+    "SUMMARY:Hackathon",
+    "URL:https://www.munich-startup.de/veranstaltungen/hackathon/",
+    "END:VEVENT",
+    "BEGIN:VEVENT",
+    "DTSTART:20260601T160000Z",
+    "DTEND:20260601T180000Z",
+    "SUMMARY:Pitch Night mit einem sehr langen Titel, der auf die nächste",
+    "  Zeile umgebrochen ist",
+    "URL:https://www.munich-startup.de/veranstaltungen/pitch-night/",
+    "END:VEVENT",
+    "END:VCALENDAR",
+    "",
+])
+
+REST_EVENTS = [
+    {
+        "title": "Startup Tag",
+        "all_day": True,
+        "start_date": "2026-05-01 00:00:00",
+        "end_date": "2026-05-01 23:59:59",
+        "utc_start_date": "2026-04-30 22:00:00",
+        "utc_end_date": "2026-05-01 21:59:59",
+        "venue": {"venue": "Werksviertel", "city": "München"},
+        "description": "<p>Ganztägig</p>",
+        "url": "https://www.munich-startup.de/veranstaltungen/startup-tag/",
+    },
+    {
+        "title": "Pitch Night",
+        "all_day": False,
+        "start_date": "2026-06-01 18:00:00",
+        "end_date": "2026-06-01 20:00:00",
+        "utc_start_date": "2026-06-01 16:00:00",
+        "utc_end_date": "2026-06-01 18:00:00",
+        "venue": [],
+        "description": "",
+        "url": "https://www.munich-startup.de/veranstaltungen/pitch-night/",
+    },
+]
+
+
+def test_parse_ical_unescapes_and_unfolds():
+    events = TribeEvents.parse_ical(ICAL)
+    assert len(events) == 3
+    assert events[0]["LOCATION"] == "Werksviertel, München"
+    assert events[0]["DESCRIPTION"] == "Erste Zeile\nZweite Zeile mit C:\\new"
+    assert events[2]["SUMMARY"] == "Pitch Night mit einem sehr langen Titel, der auf die nächste Zeile umgebrochen ist"
+
+
+def test_parse_ical_all_day_end_is_exclusive():
+    events = TribeEvents.parse_ical(ICAL)
+    assert (events[0]["DTSTART"], events[0]["DTEND"]) == ("2026-05-01", "2026-05-01")
+    assert (events[1]["DTSTART"], events[1]["DTEND"]) == ("2026-05-10", "2026-05-12")
+
+
+def test_scrape_ical_single_day_stays_single_day(monkeypatch):
+    monkeypatch.setattr(HttpFetcher, "fetch", lambda url: ICAL)
+    events = TribeEvents.scrape_ical("https://example.org/?ical=1", "Munich Startup")
+    dates = [event["Datum"] for event in events]
+    assert dates == ["2026-05-01", "2026-05-10 - 2026-05-12", "2026-06-01T18:00+02:00 - 2026-06-01T20:00+02:00"]
+    assert Datumsformatierung.parse_event_date(dates[0]) == "2026-05-01"
+
+
+def test_from_rest_all_day_uses_local_date():
+    event = TribeEvents.from_rest(REST_EVENTS[0], "Munich Startup")
+    assert event["Datum"] == "2026-05-01"
+    assert event["Location"] == "Werksviertel, München"
+    assert event["Description"] == "Ganztägig"
+
+
+def test_from_rest_timed_event_uses_utc():
+    event = TribeEvents.from_rest(REST_EVENTS[1], "Munich Startup")
+    assert event["Datum"] == "2026-06-01T18:00+02:00 - 2026-06-01T20:00+02:00"
+    assert event["Location"] == ""
+    assert event["Description"] == "Keine Description gefunden"
+
+
+def test_scrape_rest_reads_all_pages(monkeypatch):
+    pages = {
+        "1": {"events": REST_EVENTS[:1], "total_pages": 2},
+        "2": {"events": REST_EVENTS[1:], "total_pages": 2},
+    }
+    page = lambda url: json.dumps(pages[url.split("&page=")[1].split("&")[0]])
+    monkeypatch.setattr(HttpFetcher, "fetch", page)
+    monkeypatch.setattr(HttpFetcher, "fetch_all", lambda urls: [page(url) for url in urls])
+    events = TribeEvents.scrape_rest("https://www.munich-startup.de", "Munich Startup", start_date="2026-04-01")
+    assert [event["Titel"] for event in events] == ["Startup Tag", "Pitch Night"]